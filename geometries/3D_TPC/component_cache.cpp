@@ -0,0 +1,101 @@
+#include "component_cache.h"
+
+#include <cstring>
+#include <filesystem>
+#include <iomanip>
+#include <iostream>
+#include <sstream>
+#include <stdexcept>
+
+namespace tpc::geom {
+
+using DimTag = std::pair<int,int>;
+
+std::uint64_t hashComponent(const std::string &kind,
+                            const std::vector<double> &params)
+{
+  std::uint64_t h = 1469598103934665603ULL;   // FNV offset basis
+  auto mix = [&h](const unsigned char *bytes, size_t n) {
+    for (size_t i = 0; i < n; ++i) {
+      h ^= bytes[i];
+      h *= 1099511628211ULL;                  // FNV prime
+    }
+  };
+
+  const int version = kComponentCacheVersion;
+  mix(reinterpret_cast<const unsigned char*>(&version), sizeof(version));
+  mix(reinterpret_cast<const unsigned char*>(kind.data()), kind.size());
+  for (double p : params) {
+    if (p == 0.0) p = 0.0;                    // -0.0 and 0.0 hash the same
+    std::uint64_t bits;
+    std::memcpy(&bits, &p, sizeof(bits));
+    mix(reinterpret_cast<const unsigned char*>(&bits), sizeof(bits));
+  }
+  return h;
+}
+
+static int importVolume(const std::string &path)
+{
+  std::vector<DimTag> out;
+  gmsh::model::occ::importShapes(path, out, /*highestDimOnly=*/true);
+
+  std::vector<DimTag> vols;
+  for (auto &dt : out) if (dt.first == 3) vols.push_back(dt);
+  if (vols.empty())
+    throw std::runtime_error("cachedComponent: no volume in " + path);
+  if (vols.size() == 1) return vols.front().second;
+
+  // Builders return one volume, keep it that way if OCC split it on export
+  std::vector<DimTag> res;
+  std::vector<std::vector<DimTag>> map;
+  gmsh::model::occ::fuse({vols.front()}, {vols.begin() + 1, vols.end()}, res, map,
+                         /*tag=*/-1, /*removeObject=*/true, /*removeTool=*/true);
+  if (res.empty())
+    throw std::runtime_error("cachedComponent: fuse of imported volumes failed");
+  return res.front().second;
+}
+
+int cachedComponent(const std::string &kind,
+                    const std::vector<double> &params,
+                    const std::function<int()> &build,
+                    const std::string &cacheDir,
+                    bool enabled)
+{
+  if (!enabled) return build();
+
+  std::ostringstream name;
+  name << kind << "_" << std::hex << std::setw(16) << std::setfill('0')
+       << hashComponent(kind, params) << ".brep";
+  const std::filesystem::path path = std::filesystem::path(cacheDir) / name.str();
+
+  if (std::filesystem::exists(path)) {
+    std::cout << "[cache] hit  " << kind << " -> " << path.string() << "\n";
+    return importVolume(path.string());
+  }
+
+  // Miss: build in a scratch model so only this component ends up in the BREP
+  std::string current;
+  gmsh::model::getCurrent(current);
+  gmsh::model::add("component_cache_scratch");
+  const int built = build();
+  if (built < 0) {              // builder signalled failure, nothing to cache
+    gmsh::model::remove();
+    gmsh::model::setCurrent(current);
+    return built;
+  }
+  gmsh::model::occ::synchronize();
+
+  std::filesystem::create_directories(cacheDir);
+  std::filesystem::path tmp = path;
+  tmp.replace_extension(".tmp.brep");   // gmsh picks the format from the extension
+  gmsh::write(tmp.string());
+  std::filesystem::rename(tmp, path);   // no half written files on interrupt
+
+  gmsh::model::remove();
+  gmsh::model::setCurrent(current);
+  std::cout << "[cache] miss " << kind << " -> " << path.string() << "\n";
+
+  return importVolume(path.string());
+}
+
+} // namespace tpc::geom
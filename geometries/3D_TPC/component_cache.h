@@ -0,0 +1,36 @@
+#pragma once
+#include <cstdint>
+#include <functional>
+#include <string>
+#include <vector>
+
+/*
+Content addressed BREP cache for single components (electrodes, sleeves, ...)
+-> Key is the hash of the component kind + its construction parameters,
+   unchanged components are re-imported instead of redoing the OCC booleans
+*/
+
+// Gmsh API
+#include <gmsh.h>
+
+namespace tpc::geom {
+
+// Bump when a builder function changes so stale BREPs are not reused
+constexpr int kComponentCacheVersion = 1;
+
+// 64 bit FNV-1a over the kind string and the raw bits of every parameter
+std::uint64_t hashComponent(const std::string &kind,
+                            const std::vector<double> &params);
+
+// Returns the volume tag of the component in the current model.
+// On a cache hit the BREP in cacheDir is imported, on a miss `build` runs in a
+// scratch model, the result is written to cacheDir and then imported.
+// Negative tags from `build` are passed through and not cached.
+// With enabled=false `build` runs directly in the current model.
+int cachedComponent(const std::string &kind,
+                    const std::vector<double> &params,
+                    const std::function<int()> &build,
+                    const std::string &cacheDir = "brep_cache",
+                    bool enabled = true);
+
+} // namespace tpc::geom
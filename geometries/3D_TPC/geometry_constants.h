@@ -5,6 +5,17 @@
 constexpr bool debug     = true;
 constexpr bool QuickMesh = true;
 
+// Component BREP cache (see component_cache.h)
+constexpr bool UseBrepCache       = true;
+constexpr const char* BrepCacheDir = "brep_cache";
+
+// Mirror symmetry: build only x >= 0 / y >= 0 (wires, rings and sleeves are
+// symmetric about both planes); the cut faces get these boundary ids
+constexpr bool MirrorX         = false;
+constexpr bool MirrorY         = false;
+constexpr int  SymmetryX_index = 1010;
+constexpr int  SymmetryY_index = 1011;
+
 // Geometry / mesh parameters
 constexpr double DriftRegionHeight      = 0.5;
 constexpr int    n_wires_anode          = 10;
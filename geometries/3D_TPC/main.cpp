@@ -11,6 +11,7 @@
 #include "geometry_constants.h" 
 #include "partition_tools.h" 
 #include "debugging_things.h"
+#include "component_cache.h"
 using namespace tpc::dbg;
 
 //---------------------------- Electrodes --------------------------------
@@ -197,43 +198,39 @@ int main() {
   std::vector<tpc::geom::Tool> cutters;      // electrodes+PTFE (High priority cutter)
 
 
+  // Electrode assembly through the BREP cache, keyed by all construction parameters
+  auto cachedElectrode = [&](const char* name, double zBase, double zWires, int n_wires) {
+    return tpc::geom::cachedComponent(
+        name,
+        {0.0, 0.0, zBase, zWires, ring_thickness, inner_radius, outer_radius,
+         static_cast<double>(n_wires), wire_diameter},
+        [&]() {
+          return makeParallelWireElectrodeAssembly(
+              0.0, 0.0, zBase, zWires,
+              ring_thickness, inner_radius, outer_radius,
+              n_wires, wire_diameter);
+        },
+        BrepCacheDir, UseBrepCache);
+  };
+
   // --- Anode (wires at bottom extent: z_min + rWire) ---
   if (USE_ANODE) {
     const double anode_zBase       = anode_wire_height - ring_thickness;
     const double anode_wireCenterZ = anode_zBase + rWire + 0.005; // tiny nudge up
-    const int anode = makeParallelWireElectrodeAssembly(
-        0.0, 0.0, anode_zBase, anode_wireCenterZ,
-        ring_thickness, inner_radius, outer_radius,
-        n_wires_anode, wire_diameter
-    );
+    const int anode = cachedElectrode("Anode", anode_zBase, anode_wireCenterZ, n_wires_anode);
     tpc::geom::registerTool(tools, "Anode", anode, /*surfBC=*/cfg.materials.at("Anode").bc_idx, /*volBC=*/-1, &fluids, &cutters);
   }
   if (USE_GATE) {
   const double gate_zBase       = gate_wire_height;                           // ring bottom
   const double gate_wireCenterZ = gate_zBase + ring_thickness - rWire - 0.005; // tiny nudge down
-  const int gate = makeParallelWireElectrodeAssembly(
-      0.0, 0.0, gate_zBase, gate_wireCenterZ,
-      ring_thickness, inner_radius, outer_radius,
-      n_wires_gate, wire_diameter
-    );
+  const int gate = cachedElectrode("Gate", gate_zBase, gate_wireCenterZ, n_wires_gate);
     tpc::geom::registerTool(tools, "Gate", gate, /*surfBC=*/cfg.materials.at("Gate").bc_idx, /*volBC=*/-1, &fluids, &cutters);
   }
-  if (USE_GATE) {
-  const double gate_zBase       = gate_wire_height;                           // ring bottom
-  const double gate_wireCenterZ = gate_zBase + ring_thickness - rWire - 0.005; // tiny nudge down
-  const int gate = makeParallelWireElectrodeAssembly(
-      0.0, 0.0, gate_zBase, gate_wireCenterZ,
-      ring_thickness, inner_radius, outer_radate_BC_index, /*volBC=*/-1, &fluids, &cutters);
-  }
   // --- Cathode (wires at top extent: z_max - rWire) ---
   if (USE_CATHODE) {
     const double cathode_zBase       = cathode_wire_height;
     const double cathode_wireCenterZ = cathode_zBase + ring_thickness - rWire - 0.005; // tiny nudge down
-    const int cathode = makeParallelWireElectrodeAssembly(
-        0.0, 0.0, cathode_zBase, cathode_wireCenterZ,
-        ring_thickness, inner_radius, outer_radius,
-        n_wires_cathode, wire_diameter
-    );
+    const int cathode = cachedElectrode("Cathode", cathode_zBase, cathode_wireCenterZ, n_wires_cathode);
     tpc::geom::registerTool(tools, "Cathode", cathode, /*surfBC=*/cfg.materials.at("Cathode").bc_idx, /*volBC=*/-1, &fluids, &cutters);
   }
 
@@ -244,7 +241,10 @@ int main() {
     const double zMin = std::min(z0, z1);
     const double zMax = std::max(z0, z1);
     if (zMax - zMin <= 1e-9) return; // degenerate span → skip
-    const int vol = makeCylindricalSleeve(zMin, zMax, /*rInner=*/inner_radius, /*rOuter=*/outer_radius);
+    const int vol = tpc::geom::cachedComponent(
+        "PTFE", {zMin, zMax, inner_radius, outer_radius},
+        [&]() { return makeCylindricalSleeve(zMin, zMax, /*rInner=*/inner_radius, /*rOuter=*/outer_radius); },
+        BrepCacheDir, UseBrepCache);
     if (vol >= 0) {
       // No surface BC; tag as PTFE material volume
       tpc::geom::registerTool(tools, name, vol, /*surfBC=*/-1, /*volBC=*/PTFE_Volume_index, &fluids, &cutters);
@@ -279,6 +279,9 @@ int main() {
     addMedium("GXe", gate_wire_height + ring_thickness, anode_wire_height + ring_thickness, GXe_Volume_index);
   }
 
+  // --- Symmetry reduction (before fragmenting so all pieces stay consistent) ---
+  tpc::geom::cutToSymmetrySector(background_vol, tools, MirrorX, MirrorY, /*extent=*/2.0 * (R + H));
+
   tpc::geom::printRegisteredTools(tools, "Tools BEFORE fragment");
   // --- Partition background once with whatever tools we have ---
   if (!tools.empty()) {
@@ -309,8 +312,12 @@ int main() {
   gmsh::model::addPhysicalGroup(3, {background_vol}, TPC_Volume_index);
   gmsh::model::setPhysicalName(3, TPC_Volume_index, "TPC_Volume");
 
+  // Symmetry planes (homogeneous Neumann); electrode cut faces stay untagged
+  const std::vector<int> electrodeCutFaces = tpc::geom::tagSymmetryPlanes(
+      tools, MirrorX, MirrorY, SymmetryX_index, SymmetryY_index, /*extent=*/R + H);
+
   // Per-tool surfaces/volumes (based on surfBC/volBC each tool requested)
-  tpc::geom::tagPhysicals(tools);
+  tpc::geom::tagPhysicals(tools, electrodeCutFaces);
 
   // -------------------- Misc ---------------------
   gmsh::option::setNumber("General.Terminal", 1);
@@ -3,6 +3,10 @@
 #include <iostream>
 #include <unordered_set>
 #include <iomanip>
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+#include <string>
 
 namespace tpc::geom {
 
@@ -144,7 +148,8 @@ std::vector<int> getSurfaces(int volTag)
   return out;
 }
 
-void tagPhysicals(const std::vector<Tool> &tools)
+void tagPhysicals(const std::vector<Tool> &tools,
+                  const std::vector<int> &excludeSurfaces)
 {
   // Gather by group id
   std::unordered_map<int, std::vector<int>> volGroups;   // volBC -> [volume tags]
@@ -188,6 +193,14 @@ void tagPhysicals(const std::vector<Tool> &tools)
   for (auto &kv : volGroups) dedup(kv.second);
   for (auto &kv : surfGroups) dedup(kv.second);
 
+  if (!excludeSurfaces.empty()) {
+    const std::unordered_set<int> skip(excludeSurfaces.begin(), excludeSurfaces.end());
+    for (auto &kv : surfGroups)
+      kv.second.erase(std::remove_if(kv.second.begin(), kv.second.end(),
+                                     [&](int s) { return skip.count(s) > 0; }),
+                      kv.second.end());
+  }
+
   // Create volume physical groups once per volBC
   for (const auto &kv : volGroups) {
     int tag = kv.first;
@@ -213,6 +226,95 @@ void tagPhysicals(const std::vector<Tool> &tools)
   }
 }
 
+void cutToSymmetrySector(int &background_vol, std::vector<Tool> &tools,
+                         bool mirrorX, bool mirrorY, double extent)
+{
+  if (!mirrorX && !mirrorY) return;
+  const double e = 2.0 * extent;
+
+  // Boxes covering the removed half spaces
+  std::vector<DimTag> boxes;
+  if (mirrorX) boxes.emplace_back(3, gmsh::model::occ::addBox(-e, -e, -e, e, 2 * e, 2 * e));
+  if (mirrorY) boxes.emplace_back(3, gmsh::model::occ::addBox(-e, -e, -e, 2 * e, e, 2 * e));
+
+  // One cut per volume: background and tools overlap, cutting them together would
+  // also split them against each other
+  auto cutOne = [&](int tag) {
+    std::vector<DimTag> out;
+    std::vector<std::vector<DimTag>> prov;
+    gmsh::model::occ::cut({{3, tag}}, boxes, out, prov,
+                          /*tag=*/-1, /*removeObject=*/true, /*removeTool=*/false);
+    return out;
+  };
+
+  const auto background = cutOne(background_vol);
+  if (background.size() != 1)
+    throw std::runtime_error("cutToSymmetrySector: background split into "
+                             + std::to_string(background.size()) + " volumes, expected 1");
+  background_vol = background[0].second;
+
+  std::vector<Tool> kept;
+  for (const auto &tool : tools) {
+    const auto pieces = cutOne(tool.tag);
+    if (pieces.empty()) {
+      std::cout << "[symmetry] " << tool.name << " lies in the removed half, dropped\n";
+      continue;
+    }
+    for (const auto &p : pieces) {
+      Tool t = tool;
+      t.tag = p.second;
+      kept.push_back(t);
+    }
+  }
+  gmsh::model::occ::remove(boxes, /*recursive=*/true);
+  tools.swap(kept);
+  std::cout << "[symmetry] kept " << (mirrorX ? "x >= 0 " : "") << (mirrorY ? "y >= 0 " : "")
+            << "(" << tools.size() << " tool volumes)\n";
+}
+
+std::vector<int> tagSymmetryPlanes(const std::vector<Tool> &tools,
+                                   bool mirrorX, bool mirrorY,
+                                   int symXId, int symYId, double extent)
+{
+  std::vector<int> electrodeFaces;
+  if (!mirrorX && !mirrorY) return electrodeFaces;
+
+  std::unordered_set<int> electrodeVols;
+  for (const auto &t : tools) if (t.surfBC >= 0) electrodeVols.insert(t.tag);
+
+  const double tol = 1e-6 * extent;   // OCC bounding boxes carry a small tolerance
+  std::vector<int> onX, onY;
+  std::vector<DimTag> surfs;
+  gmsh::model::getEntities(surfs, 2);
+  for (const auto &s : surfs) {
+    double x0, y0, z0, x1, y1, z1;
+    gmsh::model::getBoundingBox(2, s.second, x0, y0, z0, x1, y1, z1);
+    const bool planeX = mirrorX && std::abs(x0) < tol && std::abs(x1) < tol;
+    const bool planeY = mirrorY && std::abs(y0) < tol && std::abs(y1) < tol;
+    if (!planeX && !planeY) continue;
+
+    // Cut faces inside an electrode are not part of the meshed domain
+    std::vector<int> up, down;
+    gmsh::model::getAdjacencies(2, s.second, up, down);
+    const bool fluid = std::any_of(up.begin(), up.end(),
+                                   [&](int v) { return electrodeVols.count(v) == 0; });
+    if (!fluid) { electrodeFaces.push_back(s.second); continue; }
+    (planeX ? onX : onY).push_back(s.second);
+  }
+
+  if (!onX.empty()) {
+    gmsh::model::addPhysicalGroup(2, onX, symXId);
+    gmsh::model::setPhysicalName(2, symXId, "SymmetryX");
+  }
+  if (!onY.empty()) {
+    gmsh::model::addPhysicalGroup(2, onY, symYId);
+    gmsh::model::setPhysicalName(2, symYId, "SymmetryY");
+  }
+  std::cout << "[symmetry] " << onX.size() << " faces on x = 0, " << onY.size()
+            << " on y = 0, " << electrodeFaces.size() << " electrode cut faces untagged\n";
+  return electrodeFaces;
+}
+
 static std::unordered_set<int> currentVolumeTags() {
   std::vector<DimTag> vols;
   gmsh::model::getEntities(vols, 3);
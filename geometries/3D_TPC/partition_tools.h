@@ -45,8 +45,25 @@ void carveToolsByCutters(std::vector<Tool> &fluids,
 // Return the set of (unique) surface tags bounding a volume
 std::vector<int> getSurfaces(int volTag);
 
-// Create Physical groups (surfaces/volumes) for each tool, if requested
-void tagPhysicals(const std::vector<Tool> &tools);
+// Create Physical groups (surfaces/volumes) for each tool, if requested.
+// Surfaces in excludeSurfaces are left out (e.g. electrode faces on a symmetry cut).
+void tagPhysicals(const std::vector<Tool> &tools,
+                  const std::vector<int> &excludeSurfaces = {});
+
+// Mirror-symmetric geometry: keep only x >= 0 (mirrorX) and/or y >= 0 (mirrorY) of the
+// background and every tool; call before fragmenting. Tags are updated, tools split
+// into several pieces get extra entries, tools entirely in the removed part are dropped.
+// Each volume is cut on its own; throws if the background does not stay one volume.
+// extent: any length larger than the model.
+void cutToSymmetrySector(int &background_vol, std::vector<Tool> &tools,
+                         bool mirrorX, bool mirrorY, double extent);
+
+// After synchronize: surfaces on x = 0 / y = 0 that bound a non-electrode volume become
+// the physical groups symXId / symYId (homogeneous Neumann in the solver). Returns the
+// electrode faces on the planes (interior to an electrode) for tagPhysicals to skip.
+std::vector<int> tagSymmetryPlanes(const std::vector<Tool> &tools,
+                                   bool mirrorX, bool mirrorY,
+                                   int symXId, int symYId, double extent);
 
 void printRegisteredTools(const std::vector<Tool> &tools,
                           const std::string &title = "Registered tools");
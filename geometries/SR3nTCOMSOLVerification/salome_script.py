@@ -1,11 +1,26 @@
-from salome.shaper import model
 """
 Direct transcription of the COMSOL matlab code 
+
+Headless batch use (one process per variant, each with its own --out):
+  salome shell -- python salome_script.py --out build/v1 --set WireVerticalPitch=0.024
+  -> build/v1.<Component>.brep   one 2D face (compound) per Shaper feature, e.g. v1.Gate.brep
+  -> build/v1.tags.json          component name -> its BREP file
+  -> build/v1.msh         gmsh 2.2 mesh with config.yaml ids (needs the gmsh module,
+                          otherwise rerun outside Salome with --stage mesh)
 """
 
 ## ------------   Constants --------------------------
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
+import argparse
+import json
 import math
+import os
+import sys
+
+try:
+	from salome.shaper import model
+except ImportError:   # mesh stage runs fine outside Salome
+	model = None
 
 @dataclass
 class GeometryParams:
@@ -609,9 +624,6 @@ def build_lower_cryostat(part_doc, p):
 
     return Cryostat
 
-from salome.shaper import model
-import math
-
 def build_upper_cryostat(part_doc, p):
     """
     Upper cryostat + straight section as ONE closed contour, following the
@@ -820,14 +832,6 @@ def build_gate(part_doc, p):
         Sketch.setFilletWithRadius(vertex, p.GateDeburringRadius)
 
 
-    # Gate wires 
-    for i in range(floor(p.TopStackRadialPosition/p.TopStackWireSpacing)):
-      # First center coordinates then a point the circle passes
-      Sketch.addCircle(p.GateFirstWireRadialPosition+p.TopStackWireSpacing/4+i*p.TopStackWireSpacing, 
-                       p.GateVerticalPosition,
-                       p.GateFirstWireRadialPosition+p.TopStackWireSpacing/4+i*p.TopStackWireSpacing, 
-                       p.GateVerticalPosition+50e-6)
-
     model.do()
     Gate = model.addFace(part_doc, [Sketch.result()])
     Gate.setName("Gate")
@@ -874,14 +878,6 @@ def build_anode(part_doc, p):
         Sketch.setFilletWithRadius(vertex, p.AnodeDeburringRadius)
 
 
-    # Gate wires 
-    for i in range(floor(p.TopStackRadialPosition/p.TopStackWireSpacing)):
-      # First center coordinates then a point the circle passes
-      Sketch.addCircle(p.AnodeFirstWireRadialPosition+p.TopStackWireSpacing/4+i*p.TopStackWireSpacing, 
-                       p.AnodeVerticalPosition,
-                       p.AnodeFirstWireRadialPosition+p.TopStackWireSpacing/4+i*p.TopStackWireSpacing, 
-                       p.AnodeVerticalPosition+p.TopStackWireDiameter/2)
-
     model.do()
     Anode = model.addFace(part_doc, [Sketch.result()])
     Anode.setName("Anode")
@@ -916,20 +912,224 @@ def build_gate_insulating_frame(part_doc, p):
     return GateInsulatingFrame
 
 
-if __name__ == '__main__':
-  model.begin()
+def n_top_stack_wires(p):
+    return math.floor(p.TopStackRadialPosition/p.TopStackWireSpacing)
 
-  partSet = model.moduleDocument()
+def build_wire_array(part_doc, name, x0, y0, radius, pitch, n):
+    """
+    One wire sketched once and repeated by a single MultiTranslation along OX,
+    instead of n constrained circles in one sketch.
+    """
+    Sketch = model.addSketch(part_doc, model.defaultPlane("XOY"))
+    Sketch.setName(name + "Sketch")
+    # First center coordinates then a point the circle passes
+    Sketch.addCircle(x0, y0, x0, y0 + radius)
+    model.do()
+    Wire = model.addFace(part_doc, [Sketch.result()])
+    Wire.setName(name + "Single")
+
+    Wires = model.addMultiTranslation(part_doc, [Wire.result()],
+                                      model.selection("EDGE", "PartSet/OX"), pitch, n)
+    Wires.setName(name)
+    return Wires
+
+def build_gate_wires(part_doc, p):
+    x0 = p.GateFirstWireRadialPosition + p.TopStackWireSpacing/4
+    return build_wire_array(part_doc, "GateWires", x0, p.GateVerticalPosition,
+                            p.GateWireDiameter/2, p.TopStackWireSpacing, n_top_stack_wires(p))
+
+def build_anode_wires(part_doc, p):
+    x0 = p.AnodeFirstWireRadialPosition + p.TopStackWireSpacing/4
+    return build_wire_array(part_doc, "AnodeWires", x0, p.AnodeVerticalPosition,
+                            p.TopStackWireDiameter/2, p.TopStackWireSpacing, n_top_stack_wires(p))
+
+
+## ------------   Tagging --------------------------
+# Component -> (config.yaml section, entry). Boundaries of "boundaries" components
+# become Dirichlet curves and their faces are removed (conductors are not meshed),
+# "materials" components keep their faces as volume attributes.
+COMPONENT_TAGS = {
+    "LXeCryostat":         ("materials",  "LXe"),
+    "GXeCryostat":         ("materials",  "GXe"),
+    "GateInsulatingFrame": ("materials",  "PTFE"),
+    "Gate":                ("boundaries", "Gate"),
+    "GateWires":           ("boundaries", "Gate"),
+    "Anode":               ("boundaries", "Anode"),
+    "AnodeWires":          ("boundaries", "Anode"),
+}
+# Outer contour of the cross section: curves on r = 0 get the solver's axis id,
+# the rest is the cryostat wall with its own config.yaml boundaries entry
+OUTER_WALL = "CryostatWall"
+
+## ------------   Command line --------------------------
+def parse_args(argv):
+    ap = argparse.ArgumentParser(description="SR3nT axisymmetric cross section: Shaper geometry -> BREP -> gmsh mesh")
+    ap.add_argument("--out", default="SR3nT", help="output prefix for .brep/.tags.json/.msh")
+    ap.add_argument("--config", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yaml"),
+                    help="solver config providing attr_id/bdr_id")
+    ap.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                    help="override a GeometryParams field, repeatable")
+    ap.add_argument("--params", help="JSON file with GeometryParams overrides")
+    ap.add_argument("--stage", choices=["all", "brep", "mesh"], default="all")
+    ap.add_argument("--lc-max", type=float, default=0.02, help="Mesh.MeshSizeMax")
+    ap.add_argument("--threads", type=int, default=1, help="gmsh threads per process")
+    return ap.parse_args(argv)
+
+def params_from_overrides(args):
+    overrides = {}
+    if args.params:
+        with open(args.params) as f:
+            overrides.update(json.load(f))
+    for item in args.set:
+        name, _, value = item.partition("=")
+        overrides[name.strip()] = value
+    known = {f.name: f.type for f in fields(GeometryParams)}
+    unknown = [k for k in overrides if k not in known]
+    if unknown:
+        raise SystemExit("Unknown GeometryParams field(s): " + ", ".join(unknown))
+    return replace(GeometryParams(), **{k: float(v) for k, v in overrides.items()})
+
+
+## ------------   Stages --------------------------
+def export_brep(p, out):
+    if model is None:
+        raise SystemExit("The brep stage needs Salome (salome shell -- python salome_script.py ...)")
+    model.begin()
+
+    partSet = model.moduleDocument()
+
+    # Make the cryostat
+    Cryostat = model.addPart(partSet)
+    Cryostat_doc = Cryostat.document()
+
+    parts = [
+        build_lower_cryostat(Cryostat_doc, p),
+        build_upper_cryostat(Cryostat_doc, p),
+        build_gate(Cryostat_doc, p),
+        build_gate_wires(Cryostat_doc, p),
+        build_gate_insulating_frame(Cryostat_doc, p),
+        build_anode(Cryostat_doc, p),
+        build_anode_wires(Cryostat_doc, p),
+    ]
 
-  # Make the cryostat
-  Cryostat = model.addPart(partSet)
-  Cryostat_doc = Cryostat.document()
-  p = GeometryParams()
+    # One BREP per component, named after its Shaper feature. The mesh stage
+    # fragments them (conformal shared edges) and tags faces by their origin.
+    model.do()
+    tags = {}
+    for f in parts:
+        path = f"{out}.{f.name()}.brep"
+        model.exportToFile(Cryostat_doc, path, [f.result()])
+        tags[f.name()] = os.path.basename(path)
+
+    model.end()
+
+    with open(out + ".tags.json", "w") as f:
+        json.dump(tags, f, indent=1)
+
+def mesh_from_brep(out, config_path, lc_max, threads):
+    import gmsh
+    import yaml
+
+    with open(config_path) as f:
+        cfg = yaml.safe_load(f)
+    with open(out + ".tags.json") as f:
+        breps = json.load(f)
+
+    gmsh.initialize()
+    gmsh.option.setNumber("General.Terminal", 1)
+    gmsh.model.add(cfg.get("geometry_id", "SR3nT"))
+    folder = os.path.dirname(os.path.abspath(out))
+    names, inputs = [], []
+    for name, brep in breps.items():
+        for dt in gmsh.model.occ.importShapes(os.path.join(folder, brep)):
+            if dt[0] == 2:
+                names.append(name)
+                inputs.append(dt)
+
+    # Fragment = Shaper partition; the map tells which component(s) each piece
+    # came from, where components overlap the smallest one (the inner part) wins
+    area = {name: 0.0 for name in names}
+    for name, dt in zip(names, inputs):
+        area[name] += gmsh.model.occ.getMass(*dt)
+    _, pieces_of = gmsh.model.occ.fragment(inputs, [])
+    gmsh.model.occ.synchronize()
+
+    owner = {}
+    for name, pieces in zip(names, pieces_of):
+        for _, tag in pieces:
+            if tag not in owner or area[name] < area[owner[tag]]:
+                owner[tag] = name
+    faces_by_comp = {}
+    for tag, name in owner.items():
+        faces_by_comp.setdefault(name, []).append(tag)
+
+    volumes, boundaries, conductors = {}, {}, []
+    for name, faces in faces_by_comp.items():
+        section, key = COMPONENT_TAGS.get(name, (None, None))
+        entry = (cfg.get(section) or {}).get(key) if section else None
+        if entry is None and section == "boundaries":
+            # Still a conductor: cut it out, its surface stays a natural (zero flux) boundary
+            print(f"[tags] WARNING: no boundaries.{key} entry in {config_path}, "
+                  f"'{name}' is not held at a potential")
+            conductors.extend(faces)
+            continue
+        if entry is None:
+            print(f"[tags] WARNING: {len(faces)} face(s) of '{name}' have no config entry")
+            continue
+        if section == "materials":
+            volumes.setdefault((entry["attr_id"], key), []).extend(faces)
+        else:
+            curves = [c for _, c in gmsh.model.getBoundary([(2, t) for t in faces], combined=False, oriented=False)]
+            boundaries.setdefault((entry["bdr_id"], key), []).extend(curves)
+            conductors.extend(faces)
+
+    outer = gmsh.model.getBoundary([(2, t) for t in owner], combined=True, oriented=False)
+    axis, wall = [], []
+    for _, c in outer:
+        x0, _, _, x1, _, _ = gmsh.model.getBoundingBox(1, c)
+        (axis if max(abs(x0), abs(x1)) < 1e-6 else wall).append(c)
+    solver = cfg.get("solver") or {}
+    if solver.get("axisymmetric") and axis:
+        boundaries[(solver.get("axisymmetric_r0_bd_attribute", 9999), "Axis")] = axis
+    entry = (cfg.get("boundaries") or {}).get(OUTER_WALL)
+    if entry is None:
+        print(f"[tags] WARNING: no boundaries.{OUTER_WALL} entry in {config_path}, the cryostat wall is untagged")
+    else:
+        boundaries.setdefault((entry["bdr_id"], OUTER_WALL), []).extend(wall)
+
+    # Conductors are holes in the dielectric, only their boundary carries the BC
+    gmsh.model.occ.remove([(2, t) for t in conductors])
+    gmsh.model.occ.synchronize()
+
+    for (attr, key), faces in volumes.items():
+        gmsh.model.addPhysicalGroup(2, faces, attr)
+        gmsh.model.setPhysicalName(2, attr, key)
+    for (bdr, key), curves in boundaries.items():
+        gmsh.model.addPhysicalGroup(1, sorted(set(curves)), bdr)
+        gmsh.model.setPhysicalName(1, bdr, key)
+
+    gmsh.option.setNumber("Mesh.SaveAll", 0)
+    gmsh.option.setNumber("Mesh.MshFileVersion", 2.2)
+    gmsh.option.setNumber("Mesh.Optimize", 1)
+    gmsh.option.setNumber("Mesh.MeshSizeMax", lc_max)
+    gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 12)   # resolves the wires
+    gmsh.option.setNumber("General.NumThreads", threads)
+    gmsh.model.mesh.generate(2)
+    gmsh.write(out + ".msh")
+    gmsh.finalize()
+    print("Created mesh file " + out + ".msh")
 
-  LXeCryostat = build_lower_cryostat(Cryostat_doc, p)
-  GXeCryostat = build_upper_cryostat(Cryostat_doc, p)
-  Gate = build_gate(Cryostat_doc, p)
-  GateInsulatingFrame = build_gate_insulating_frame(Cryostat_doc, p)
-  Anode = build_anode(Cryostat_doc, p)
 
-  model.end()
+if __name__ == '__main__':
+  args = parse_args(sys.argv[1:])
+  p = params_from_overrides(args)
+  os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+
+  if args.stage in ("all", "brep"):
+    export_brep(p, args.out)
+  if args.stage in ("all", "mesh"):
+    try:
+      mesh_from_brep(args.out, args.config, args.lc_max, args.threads)
+    except ImportError as e:
+      if args.stage == "mesh": raise
+      print(f"[mesh] skipped ({e}), run: python {sys.argv[0]} --stage mesh --out {args.out}")
@@ -1,6 +1,10 @@
 #include "ComputeElectricField.h"
+#include "element_locator.h"
 #include <fstream>
 #include <algorithm>
+#include <cmath>
+#include <limits>
+#include <vector>
 
 using namespace mfem;
 
@@ -174,3 +178,142 @@ void SaveEComponents(const GridFunction &E, const std::string &prefix)
   MFEM_VERIFY(g_post, "SaveEComponents: call InitFieldPostprocessor() first.");
   g_post->SaveComponents(E, prefix);
 }
+
+// -------------------- Axisymmetric revolved export --------------------------
+
+namespace {
+void WriteRevolvedRow(std::ofstream &ofs, double r, double z, double theta,
+                      double v, double er, double ez)
+{
+  const double c = std::cos(theta), s = std::sin(theta);
+  ofs << r * c << "," << r * s << "," << z << ","
+      << v << "," << er * c << "," << er * s << "," << ez << "\n";
+}
+} // namespace
+
+void SaveRevolvedPoints(const GridFunction &V, const GridFunction &E,
+                        const std::string &path, int n_theta)
+{
+  MFEM_VERIFY(n_theta > 0, "SaveRevolvedPoints: n_theta must be positive.");
+  const Mesh &mesh = *V.FESpace()->GetMesh();
+  MFEM_VERIFY(mesh.Dimension() == 2, "SaveRevolvedPoints: expects a 2D (r,z) mesh.");
+
+  // Vertex values (E is discontinuous -> averaged over adjacent elements)
+  Vector Vn, Er, Ez;
+  V.GetNodalValues(Vn);
+  E.GetNodalValues(Er, 1);
+  E.GetNodalValues(Ez, 2);
+
+  std::ofstream ofs(path);
+  ofs.precision(10);
+  ofs << "x,y,z,V,Ex,Ey,Ez\n";
+  for (int v = 0; v < mesh.GetNV(); ++v)
+  {
+    const double *X = mesh.GetVertex(v);
+    const double r = std::max(X[0], 0.0), z = X[1];
+    const int n = (r > 0.0) ? n_theta : 1;     // axis points only once
+    for (int k = 0; k < n; ++k)
+      WriteRevolvedRow(ofs, r, z, 2.0 * M_PI * k / n_theta, Vn(v), Er(v), Ez(v));
+  }
+}
+
+void SaveRevolvedGrid(const GridFunction &V, const GridFunction &E,
+                      const std::string &path, int nx, int ny, int nz)
+{
+  MFEM_VERIFY(nx > 1 && ny > 1 && nz > 1, "SaveRevolvedGrid: need at least 2 samples per axis.");
+  Mesh &mesh = *V.FESpace()->GetMesh();
+  MFEM_VERIFY(mesh.Dimension() == 2, "SaveRevolvedGrid: expects a 2D (r,z) mesh.");
+
+  Vector bb_min, bb_max;
+  mesh.GetBoundingBox(bb_min, bb_max);
+  const double R = bb_max(0);
+  const double z0 = bb_min(1), z1 = bb_max(1);
+
+  // Locate all (r,z) samples in one binned search (Mesh::FindPoints is O(N x NE))
+  const int N = nx * ny * nz;
+  DenseMatrix rz(2, N);
+  for (int k = 0, p = 0; k < nz; ++k)
+    for (int j = 0; j < ny; ++j)
+      for (int i = 0; i < nx; ++i, ++p)
+      {
+        const double x = -R + 2.0 * R * i / (nx - 1);
+        const double y = -R + 2.0 * R * j / (ny - 1);
+        rz(0, p) = std::hypot(x, y);
+        rz(1, p) = z0 + (z1 - z0) * k / (nz - 1);
+      }
+
+  Array<int> elem_ids;
+  Array<IntegrationPoint> ips;
+  ElementLocator(mesh).FindPoints(rz, elem_ids, ips);
+
+  const double nan = std::numeric_limits<double>::quiet_NaN();
+  Vector Ev(2);
+  std::ofstream ofs(path);
+  ofs.precision(10);
+  ofs << "x,y,z,V,Ex,Ey,Ez\n";
+  for (int k = 0, p = 0; k < nz; ++k)
+    for (int j = 0; j < ny; ++j)
+      for (int i = 0; i < nx; ++i, ++p)
+      {
+        const double x = -R + 2.0 * R * i / (nx - 1);
+        const double y = -R + 2.0 * R * j / (ny - 1);
+        const double theta = std::atan2(y, x);
+        if (elem_ids[p] < 0)
+        {
+          ofs << x << "," << y << "," << rz(1, p) << ","
+              << nan << "," << nan << "," << nan << "," << nan << "\n";
+          continue;
+        }
+        E.GetVectorValue(elem_ids[p], ips[p], Ev);
+        WriteRevolvedRow(ofs, rz(0, p), rz(1, p), theta,
+                         V.GetValue(elem_ids[p], ips[p]), Ev(0), Ev(1));
+      }
+}
+
+// -------------------- Mirror symmetry ---------------------------------------
+
+void FoldIntoSymmetrySector(Vector &x, Vector &sign, bool mirror_x, bool mirror_y)
+{
+  sign.SetSize(x.Size());
+  sign = 1.0;
+  if (mirror_x && x(0) < 0.0)                 { x(0) = -x(0); sign(0) = -1.0; }
+  if (mirror_y && x.Size() > 1 && x(1) < 0.0) { x(1) = -x(1); sign(1) = -1.0; }
+}
+
+void SaveMirroredPoints(const GridFunction &V, const GridFunction &E,
+                        const std::string &path, bool mirror_x, bool mirror_y)
+{
+  const Mesh &mesh = *V.FESpace()->GetMesh();
+  const int sdim = mesh.SpaceDimension();
+
+  // Vertex values (E is discontinuous -> averaged over adjacent elements)
+  Vector Vn;
+  V.GetNodalValues(Vn);
+  std::vector<Vector> Ec(sdim);
+  for (int d = 0; d < sdim; ++d) E.GetNodalValues(Ec[d], d + 1);
+
+  // Points on a mirror plane are written once
+  Vector bb_min, bb_max;
+  mesh.GetBoundingBox(bb_min, bb_max);
+  const double tol = 1e-12 * std::max(1.0, bb_max.Normlinf());
+
+  std::ofstream ofs(path);
+  ofs.precision(10);
+  ofs << "x,y,z,V,Ex,Ey,Ez\n";
+  for (int v = 0; v < mesh.GetNV(); ++v)
+  {
+    const double *X = mesh.GetVertex(v);
+    const int nsx = (mirror_x && X[0] > tol) ? 2 : 1;
+    const int nsy = (mirror_y && sdim > 1 && X[1] > tol) ? 2 : 1;
+    for (int iy = 0; iy < nsy; ++iy)
+      for (int ix = 0; ix < nsx; ++ix)
+      {
+        // V is even under the reflection, the normal E component is odd
+        const double s[3] = {ix ? -1.0 : 1.0, iy ? -1.0 : 1.0, 1.0};
+        for (int d = 0; d < 3; ++d) ofs << (d < sdim ? s[d] * X[d] : 0.0) << ",";
+        ofs << Vn(v);
+        for (int d = 0; d < 3; ++d) ofs << "," << (d < sdim ? s[d] * Ec[d](v) : 0.0);
+        ofs << "\n";
+      }
+  }
+}
@@ -54,4 +54,19 @@ void ComputeElectricField(mfem::GridFunction &V, mfem::GridFunction &E, double s
 void ComputeFieldMagnitude(const mfem::GridFunction &E, mfem::GridFunction &Emag);
 void SaveEComponents(const mfem::GridFunction &E, const std::string &prefix);
 
+// -------- Axisymmetric (r,z) -> 3D export (r = x, z = y of the 2D mesh) --------
+// CSV "x,y,z,V,Ex,Ey,Ez". Points: every mesh vertex revolved n_theta times (axis once).
+void SaveRevolvedPoints(const mfem::GridFunction &V, const mfem::GridFunction &E,
+                        const std::string &path, int n_theta);
+// Grid: regular nx*ny*nz grid over the revolved bounding box, NaN outside the mesh.
+void SaveRevolvedGrid(const mfem::GridFunction &V, const mfem::GridFunction &E,
+                      const std::string &path, int nx, int ny, int nz);
+
+// -------- Mirror symmetry (mesh covers x >= 0 and/or y >= 0 only) --------
+// Folds x into the reduced domain; sign(d) = -1 where E_d flips under the reflection
+void FoldIntoSymmetrySector(mfem::Vector &x, mfem::Vector &sign, bool mirror_x, bool mirror_y);
+// CSV "x,y,z,V,Ex,Ey,Ez": every vertex in all its mirror images (points on a plane once)
+void SaveMirroredPoints(const mfem::GridFunction &V, const mfem::GridFunction &E,
+                        const std::string &path, bool mirror_x, bool mirror_y);
+
 #endif // COMPUTE_ELECTRIC_FIELD_H
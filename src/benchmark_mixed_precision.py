@@ -0,0 +1,114 @@
+"""
+Time and memory of solver.mixed_precision on/off for the shipped geometries
+
+  python benchmark_mixed_precision.py --solver build/SOLVER
+  python benchmark_mixed_precision.py --solver build/SOLVER --csv mixed.csv \
+      ../geometries/2DTPC/config.yaml=build/2DTPC/geometry.msh
+
+Each case is CONFIG[=MESH]; without cases every shipped config is run, with the mesh
+at its mesh.path (relative to the config, where the geometry executables write it).
+Every case runs twice from a temporary copy of the config (MPI off, mixed_precision
+false/true) and reports the [Solve]/[Mixed] lines and the peak RSS of the run.
+"""
+import argparse
+import csv
+import glob
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+import yaml
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GEOMETRIES = os.path.normpath(os.path.join(HERE, "..", "geometries"))
+SHIPPED = sorted(glob.glob(os.path.join(GEOMETRIES, "*", "config.yaml"))) + [
+    # 3D_TPC writes tpc_occ.msh regardless of mesh.path
+    os.path.join(GEOMETRIES, "3D_TPC", "solver_params.yaml") + "=" + os.path.join(GEOMETRIES, "3D_TPC", "tpc_occ.msh")]
+
+SOLVE_RE = re.compile(r"\[Solve\] .*?: (\d+) CG iterations in ([0-9.eE+-]+) s .*setup ([0-9.eE+-]+) s")
+
+
+def parse_case(case):
+    config, _, mesh = case.partition("=")
+    config = os.path.abspath(config)
+    if not mesh:
+        with open(config) as f:
+            cfg = yaml.safe_load(f)
+        mesh = os.path.join(os.path.dirname(config), (cfg.get("mesh") or {}).get("path", "geometry.msh"))
+    return config, os.path.abspath(mesh)
+
+
+def run(solver, config, mesh, mixed, workdir):
+    with open(config) as f:
+        cfg = yaml.safe_load(f)
+    cfg.setdefault("compute", {}).setdefault("mpi", {})["enabled"] = False   # mixed is serial only
+    cfg.setdefault("solver", {})["mixed_precision"] = mixed
+    tmp_cfg = os.path.join(workdir, "config.yaml")
+    with open(tmp_cfg, "w") as f:
+        yaml.safe_dump(cfg, f)
+
+    log_path = os.path.join(workdir, "mixed.log" if mixed else "double.log")
+    with open(log_path, "w") as log:
+        proc = subprocess.Popen([solver, "-c", tmp_cfg, "-m", mesh], cwd=workdir,
+                                stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(proc.pid, 0)   # rusage of this child only
+        proc.returncode = os.waitstatus_to_exitcode(status)
+    with open(log_path) as f:
+        lines = f.read().splitlines()
+
+    row = {"config": config, "mesh": mesh, "mixed_precision": mixed, "exit": proc.returncode,
+           "iterations": "", "solve_s": "", "setup_s": "",
+           "peak_rss_mib": round(usage.ru_maxrss / 1024.0, 1),   # ru_maxrss is KiB on Linux
+           "solve_line": "", "mixed_line": ""}
+    for line in lines:
+        if line.startswith("[Solve]") and "CG iterations" in line:
+            row["solve_line"] = line
+            m = SOLVE_RE.search(line)
+            if m:
+                row["iterations"], row["solve_s"], row["setup_s"] = m.groups()
+        elif line.startswith("[Mixed] float copy"):
+            row["mixed_line"] = line
+    if proc.returncode != 0:
+        print(f"[bench] {os.path.basename(config)} mixed={mixed} exited with {proc.returncode}, "
+              f"log: {log_path}", file=sys.stderr)
+    return row
+
+
+def main(argv):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--solver", required=True, help="solver executable (SOLVER / TPC)")
+    ap.add_argument("--csv", help="also write the rows to this CSV file")
+    ap.add_argument("cases", nargs="*", metavar="CONFIG[=MESH]")
+    args = ap.parse_args(argv)
+
+    solver = os.path.abspath(args.solver)
+    rows = []
+    for case in (args.cases or SHIPPED):
+        config, mesh = parse_case(case)
+        if not os.path.exists(mesh):
+            print(f"[bench] skip {config}: mesh {mesh} not found", file=sys.stderr)
+            continue
+        workdir = tempfile.mkdtemp(prefix="bench_mixed_")
+        for mixed in (False, True):
+            rows.append(run(solver, config, mesh, mixed, workdir))
+
+    print(f"{'config':<40} {'mixed':>5} {'its':>7} {'solve s':>9} {'setup s':>9} {'peak MiB':>9}")
+    for r in rows:
+        name = os.path.join(os.path.basename(os.path.dirname(r["config"])), os.path.basename(r["config"]))
+        print(f"{name:<40} {str(r['mixed_precision']):>5} {r['iterations']:>7} {r['solve_s']:>9} "
+              f"{r['setup_s']:>9} {r['peak_rss_mib']:>9}")
+        if r["mixed_line"]:
+            print(f"{'':<40} {r['mixed_line']}")
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else ["config"])
+            w.writeheader()
+            w.writerows(rows)
+    return 0 if all(r["exit"] == 0 for r in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
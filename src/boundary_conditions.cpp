@@ -44,24 +44,52 @@ Array<int> GetDirichletAttributes(mfem::Mesh *mesh,
         }
     }
 
+    // Mirror planes are homogeneous Neumann (the natural BC): never essential
+    const auto &sym = cfg->solver.symmetry;
+    for (const auto &[on, id] : {std::pair<bool,int>{sym.x, sym.x_bdr_id}, std::pair<bool,int>{sym.y, sym.y_bdr_id}})
+    {
+        if (!on) continue;
+        if (id <= 0 || mesh->bdr_attributes.Find(id) == -1)
+        {
+            std::cerr << "\033[33m" << "WARNING: symmetry plane bdr_id " << id
+                      << " not present in mesh (is the geometry cut?)" << "\033[0m\n";
+            continue;
+        }
+        if (id <= ess.Size() && ess[id - 1])
+        {
+            std::cerr << "\033[33m" << "WARNING: symmetry plane bdr_id " << id
+                      << " is listed as dirichlet, treating it as a symmetry plane" << "\033[0m\n";
+            ess[id - 1] = 0;
+        }
+    }
+
     return ess;
 }
 
 
 
-void ApplyDirichletValues(GridFunction &V, const Array<int> &dirichlet_attr, const std::shared_ptr<const Config>& cfg)
+void ApplyDirichletValues(GridFunction &V, const Array<int> &dirichlet_attr, const std::shared_ptr<const Config>& cfg,
+                          const std::unordered_map<int, double> &overrides)
 {
     Mesh *mesh = V.FESpace()->GetMesh();
-    // Iterate config elements with dirichlet attributes
+    const int max_id = mesh->bdr_attributes.Size() ? mesh->bdr_attributes.Max() : 0;
+
+    // bdr attribute -> value, projected in a single pass over the boundary elements
+    // (one marker + ProjectBdrCoefficient per electrode is O(#electrodes x #bdr elements))
+    Vector values(std::max(1, max_id));
+    values = 0.0;
+    Array<int> marker(std::max(1, max_id));
+    marker = 0;
+
     for (const auto& [name, bc] :cfg->boundaries)
     {
       if (bc.type != "dirichlet") continue; 
 
-      Array<int> marker = MakeBdrMarker(mesh, {bc.bdr_id});
-      if (marker.Max() == 1)
+      if (bc.bdr_id <= max_id && mesh->bdr_attributes.FindSorted(bc.bdr_id) != -1)
       {
-        ConstantCoefficient Vcoef(bc.value);
-        V.ProjectBdrCoefficient(Vcoef, marker);
+        auto it = overrides.find(bc.bdr_id);
+        values(bc.bdr_id - 1) = it != overrides.end() ? it->second : bc.value;
+        marker[bc.bdr_id - 1] = 1;
         if (cfg->debug.debug) {
           std::cout << "Applied Dirichlet BC " << name << " '(bdr_id = " << bc.bdr_id << ")'\n";
         }
@@ -71,4 +99,112 @@ void ApplyDirichletValues(GridFunction &V, const Array<int> &dirichlet_attr, con
         std::cerr << "\033[33m" << "WARNING: boundary " << name << "'(bdr_id= " << bc.bdr_id << ")' not present in mesh!\n" << "\033[0m\n";
       }
     }
+
+    if (marker.Max() == 1)
+    {
+      PWConstCoefficient Vcoef(values);   // evaluated with the boundary attribute
+      V.ProjectBdrCoefficient(Vcoef, marker);
+    }
+}
+
+
+// Robin coefficient eps*alpha(x) (times 2*pi*r when axisymmetric).
+// Asymptotic model: far field phi ~ r^-m  =>  dphi/dn = (n.r_hat) dphi/dr = -m (n.r_hat)/r phi,
+// i.e. alpha = m (n.r_hat)/r (first order Bayliss-Turkel). Exact on a sphere around the
+// charges, good enough on a box that is a few device sizes away.
+class RobinCoefficient : public Coefficient
+{
+public:
+    RobinCoefficient(const Boundary &bc, double eps, bool axisymmetric, int sdim)
+      : asymptotic_(bc.model == "asymptotic"), alpha_(bc.alpha), decay_(bc.decay),
+        eps_(eps), axisymmetric_(axisymmetric), center_(sdim)
+    {
+        center_ = 0.0;
+        for (int d = 0; d < sdim && d < static_cast<int>(bc.center.size()); ++d)
+            center_(d) = bc.center[d];
+    }
+
+    double Eval(ElementTransformation &T, const IntegrationPoint &ip) override
+    {
+        T.SetIntPoint(&ip);
+        T.Transform(ip, x_);
+        const double w = axisymmetric_ ? 2.0 * M_PI * std::max(x_(0), 0.0) : 1.0;
+        if (!asymptotic_) return w * eps_ * alpha_;
+
+        nor_.SetSize(x_.Size());
+        CalcOrtho(T.Jacobian(), nor_);
+        x_ -= center_;
+        const double r = x_.Norml2();
+        if (r == 0.0) return 0.0;
+        // |n.r_hat|: gmsh boundary elements are not consistently oriented
+        const double cos_nr = std::abs(nor_ * x_) / (nor_.Norml2() * r);
+        return w * eps_ * decay_ * cos_nr / r;
+    }
+
+private:
+    bool   asymptotic_;
+    double alpha_;
+    int    decay_;
+    double eps_;
+    bool   axisymmetric_;
+    Vector center_, x_, nor_;
+};
+
+// Permittivity of the elements next to boundary `bdr_id` (first one found)
+static double AdjacentEpsilon(const Mesh &mesh, int bdr_id, PWConstCoefficient &eps)
+{
+    double value = -1.0;
+    for (int be = 0; be < mesh.GetNBE(); ++be)
+    {
+        if (mesh.GetBdrAttribute(be) != bdr_id) continue;
+        int e1, e2;
+        mesh.GetFaceElements(mesh.GetBdrElementFaceIndex(be), &e1, &e2);
+        const double e = eps(mesh.GetAttribute(e1));
+        if (value < 0.0) { value = e; }
+        else if (e != value)
+        {
+            std::cerr << "\033[33m" << "WARNING: Robin boundary (bdr_id= " << bdr_id
+                      << ") touches several materials, using epsilon_r = " << value << "\033[0m\n";
+            break;
+        }
+    }
+    return value > 0.0 ? value : 1.0;
+}
+
+int AddRobinBoundaries(BilinearForm &a, LinearForm &b, PWConstCoefficient &eps,
+                       const std::shared_ptr<const Config>& cfg, RobinTerms &terms)
+{
+    Mesh *mesh = a.FESpace()->GetMesh();
+    int added = 0;
+    for (const auto& [name, bc] : cfg->boundaries)
+    {
+        if (bc.type != "robin") continue;
+
+        auto marker = std::make_unique<Array<int>>(MakeBdrMarker(mesh, {bc.bdr_id}));
+        if (marker->Max() != 1)
+        {
+            std::cerr << "\033[33m" << "WARNING: boundary " << name << "'(bdr_id= " << bc.bdr_id << ")' not present in mesh!\n" << "\033[0m\n";
+            continue;
+        }
+
+        const double eps_b = AdjacentEpsilon(*mesh, bc.bdr_id, eps);
+        auto alpha = std::make_unique<RobinCoefficient>(bc, eps_b, cfg->solver.axisymmetric,
+                                                        mesh->SpaceDimension());
+        a.AddBoundaryIntegrator(new BoundaryMassIntegrator(*alpha), *marker);
+        if (bc.value != 0.0)
+        {
+            auto g = std::make_unique<ProductCoefficient>(bc.value, *alpha);
+            b.AddBoundaryIntegrator(new BoundaryLFIntegrator(*g), *marker);
+            terms.coeffs.push_back(std::move(g));
+        }
+        terms.coeffs.push_back(std::move(alpha));
+        terms.markers.push_back(std::move(marker));
+        ++added;
+
+        if (cfg->debug.debug) {
+          std::cout << "Applied Robin BC " << name << " '(bdr_id = " << bc.bdr_id << ", "
+                    << bc.model << ", epsilon_r = " << eps_b << ")'\n";
+        }
+    }
+    return added;
 }
@@ -4,10 +4,29 @@
 #include "mfem.hpp"
 #include "boundary_conditions.h"
 #include "config/Config.h"
+#include <memory>
+#include <unordered_map>
+#include <vector>
 using namespace mfem;
 
 
 Array<int> GetDirichletAttributes(Mesh *mesh, const std::shared_ptr<const Config>&);
-void ApplyDirichletValues(GridFunction &V, const Array<int> &dirichlet_attr, const std::shared_ptr<const Config>&);
+// overrides: bdr_id -> value, replaces the config value of that boundary
+void ApplyDirichletValues(GridFunction &V, const Array<int> &dirichlet_attr, const std::shared_ptr<const Config>&,
+                          const std::unordered_map<int, double> &overrides = {});
+
+// Coefficients and markers of the Robin terms, must outlive the forms they were added to
+struct RobinTerms
+{
+    std::vector<std::unique_ptr<Coefficient>> coeffs;
+    std::vector<std::unique_ptr<Array<int>>>  markers;
+};
+
+// For every "robin" boundary adds eps*dphi/dn + alpha*(phi - value) = 0:
+// boundary mass alpha on a, alpha*value on b (times 2*pi*r when axisymmetric).
+// "asymptotic" takes alpha = eps*decay*(n.r_hat)/r around `center` (open boundary).
+// Returns the number of boundaries added.
+int AddRobinBoundaries(BilinearForm &a, LinearForm &b, PWConstCoefficient &eps,
+                       const std::shared_ptr<const Config>&, RobinTerms &terms);
 
 #endif
@@ -33,9 +33,10 @@ std::filesystem::path to_absolute(const std::filesystem::path& p) {
 
 void print_usage(const char* prog) {
     std::cerr
-        << "Usage: " << prog << " [-c <config.yaml>] [-m <model>] [--help]\n"
+        << "Usage: " << prog << " [-c <config.yaml>] [-m <model>] [-s <socket>] [--help]\n"
         << "  -c, --config   Path to YAML config (default: config/config.yaml)\n"
         << "  -m, --model    Path to model/resource\n"
+        << "  -s, --serve    Run as solver service on this UNIX socket path\n"
         << "  -h, --help     Show this help\n";
 }
 
@@ -3,6 +3,7 @@
 #include <yaml-cpp/yaml.h>
 #include <stdexcept>
 #include <iostream>
+#include <vector>
 
 // read int or "auto"
 static std::pair<int,bool> read_int_or_auto(const YAML::Node& n, int dflt_val, bool dflt_auto=true)
@@ -98,6 +99,67 @@ static void apply_preset_defaults(Config &cfg)
 }
 
 
+// voltage_dividers.* -> one dirichlet boundary per ring ("<name>_<k>").
+// Ring k sits at first + (last - first) * sum(R_0..R_k-1) / sum(R).
+static void parse_voltage_dividers(Config &cfg, const YAML::Node& root)
+{
+    if (!root["voltage_dividers"]) return;
+
+    for (const auto &it : root["voltage_dividers"]) {
+        const std::string name = it.first.as<std::string>();
+        const auto D = it.second;
+        auto fail = [&](const std::string &msg) {
+            throw std::runtime_error("Voltage divider '" + name + "': " + msg);
+        };
+
+        // Ring boundaries: explicit list or a contiguous id range
+        std::vector<int> ids;
+        if (D["bdr_ids"]) {
+            ids = D["bdr_ids"].as<std::vector<int>>();
+        } else {
+            const int first_id = D["first_bdr_id"].as<int>(-1);
+            const int count    = D["count"].as<int>(0);
+            if (first_id <= 0 || count <= 0) fail("needs bdr_ids or first_bdr_id + count");
+            for (int k = 0; k < count; ++k) ids.push_back(first_id + k);
+        }
+        const int n = static_cast<int>(ids.size());
+        if (n < 2) fail("needs at least two rings");
+
+        // Resistors between consecutive rings: one value (equal chain) or n-1 values
+        std::vector<double> R;
+        if (!D["resistors"]) fail("missing resistors");
+        if (D["resistors"].IsSequence()) R = D["resistors"].as<std::vector<double>>();
+        else                             R.assign(n - 1, D["resistors"].as<double>());
+        if (static_cast<int>(R.size()) != n - 1)
+            fail("expected " + std::to_string(n - 1) + " resistors, got " + std::to_string(R.size()));
+
+        double R_total = 0.0;
+        for (double r : R) {
+            if (r <= 0.0) fail("resistors must be positive");
+            R_total += r;
+        }
+
+        if (!D["first_value"] || !D["last_value"]) fail("needs first_value and last_value");
+        const double V_first = D["first_value"].as<double>();
+        const double V_last  = D["last_value"].as<double>();
+
+        double R_acc = 0.0;
+        for (int k = 0; k < n; ++k) {
+            Boundary b;
+            b.bdr_id = ids[k];
+            b.type   = "dirichlet";
+            b.value  = V_first + (V_last - V_first) * R_acc / R_total;
+            if (k < n - 1) R_acc += R[k];
+
+            for (const auto &[other, ob] : cfg.boundaries)
+                if (ob.bdr_id == b.bdr_id)
+                    fail("bdr_id " + std::to_string(b.bdr_id) + " already used by boundary '" + other + "'");
+            cfg.boundaries[name + "_" + std::to_string(k)] = b;
+        }
+    }
+}
+
+
 
 // parse compute.* blocks
 static void parse_compute(Config &cfg, const YAML::Node& root)
@@ -174,6 +236,9 @@ Config LoadFromNode(const YAML::Node &root) {
   // --- Mesh path
   if (root["mesh"] && root["mesh"]["path"])
     cfg.mesh.path = root["mesh"]["path"].as<std::string>("geometry.msh");
+  if (root["mesh"]) {
+    cfg.mesh.element_order = root["mesh"]["element_order"].as<std::string>(cfg.mesh.element_order);
+  }
 
 
   // --- Debug
@@ -185,6 +250,10 @@ Config LoadFromNode(const YAML::Node &root) {
   // --- Solver
   if (root["solver"]) {
     const auto s = root["solver"];
+    cfg.solver.axisymmetric = s["axisymmetric"].as<bool>(cfg.solver.axisymmetric);
+    cfg.solver.axisymmetric_r0_bd_attribute =
+        s["axisymmetric_r0_bd_attribute"].as<int>(cfg.solver.axisymmetric_r0_bd_attribute);
+    cfg.solver.order       = s["order"].as<int>(cfg.solver.order);
     cfg.solver.atol        = s["atol"].as<double>(1.0);
     cfg.solver.rtol        = s["rtol"].as<double>(0.0);
     cfg.solver.maxiter     = s["maxiter"].as<int>(100000);
@@ -198,6 +267,50 @@ Config LoadFromNode(const YAML::Node &root) {
     if (s["assembly_mode"]) cfg.solver.assembly_mode = s["assembly_mode"].as<std::string>(cfg.solver.assembly_mode);
     if (s["solver"])        cfg.solver.solver        = s["solver"].as<std::string>(cfg.solver.solver);
     if (s["precond"])       cfg.solver.precond       = s["precond"].as<std::string>(cfg.solver.precond);
+    cfg.solver.partial_assembly = s["partial_assembly"].as<bool>(cfg.solver.partial_assembly);
+
+    // Mixed precision (optional)
+    cfg.solver.mixed_precision     = s["mixed_precision"].as<bool>(cfg.solver.mixed_precision);
+    cfg.solver.mixed_inner_rtol    = s["mixed_inner_rtol"].as<double>(cfg.solver.mixed_inner_rtol);
+    cfg.solver.mixed_inner_maxiter = s["mixed_inner_maxiter"].as<int>(cfg.solver.mixed_inner_maxiter);
+    cfg.solver.mixed_max_refine    = s["mixed_max_refine"].as<int>(cfg.solver.mixed_max_refine);
+
+    // Revolved 3D output of an axisymmetric (r,z) solution (optional)
+    if (s["revolve"]) {
+      const auto r = s["revolve"];
+      cfg.solver.revolve.path    = r["path"].as<std::string>(cfg.solver.revolve.path);
+      cfg.solver.revolve.mode    = r["mode"].as<std::string>(cfg.solver.revolve.mode);
+      cfg.solver.revolve.n_theta = r["n_theta"].as<int>(cfg.solver.revolve.n_theta);
+      cfg.solver.revolve.nx      = r["nx"].as<int>(cfg.solver.revolve.nx);
+      cfg.solver.revolve.ny      = r["ny"].as<int>(cfg.solver.revolve.ny);
+      cfg.solver.revolve.nz      = r["nz"].as<int>(cfg.solver.revolve.nz);
+    }
+    if (s["warm_start"]) {
+      const auto w = s["warm_start"];
+      cfg.solver.warm_start.mesh     = w["mesh"].as<std::string>(cfg.solver.warm_start.mesh);
+      cfg.solver.warm_start.solution = w["solution"].as<std::string>(cfg.solver.warm_start.solution);
+    }
+    if (s["goal"]) {
+      const auto g = s["goal"];
+      auto &goal = cfg.solver.goal;
+      goal.every   = g["every"].as<int>(goal.every);
+      goal.rtol    = g["rtol"].as<double>(goal.rtol);
+      goal.window  = g["window"].as<int>(goal.window);
+      goal.energy  = g["energy"].as<bool>(goal.energy);
+      goal.history = g["history"].as<std::string>(goal.history);
+      if (g["probes"])  goal.probes  = g["probes"].as<std::vector<std::vector<double>>>();
+      if (g["regions"]) goal.regions = g["regions"].as<std::vector<int>>();
+      if (g["charges"]) goal.charges = g["charges"].as<std::vector<int>>();
+    }
+    if (s["symmetry"]) {
+      const auto m = s["symmetry"];
+      auto &sym = cfg.solver.symmetry;
+      sym.x        = m["x"].as<bool>(sym.x);
+      sym.y        = m["y"].as<bool>(sym.y);
+      sym.x_bdr_id = m["x_bdr_id"].as<int>(sym.x_bdr_id);
+      sym.y_bdr_id = m["y_bdr_id"].as<int>(sym.y_bdr_id);
+      sym.path     = m["path"].as<std::string>(sym.path);
+    }
   }
 
   // --- Materials
@@ -221,12 +334,21 @@ Config LoadFromNode(const YAML::Node &root) {
       b.bdr_id = node["bdr_id"].as<int>(-1);
       b.type   = node["type"].as<std::string>("dirichlet");
       b.value  = node["value"].as<double>(0.0);
+      b.model  = node["model"].as<std::string>(b.model);
+      b.alpha  = node["alpha"].as<double>(b.alpha);
+      b.decay  = node["decay"].as<int>(b.decay);
+      if (node["center"]) b.center = node["center"].as<std::vector<double>>();
       if (b.bdr_id <= 0)
           throw std::runtime_error("Boundary '" + name + "' is missing a valid bdr_id");
+      if (b.type == "robin" && b.model != "asymptotic" && b.model != "constant")
+          throw std::runtime_error("Boundary '" + name + "': robin model must be 'asymptotic' or 'constant'");
       cfg.boundaries[name] = b;
     }
   }
 
+  // --- Resistor chains (field cage rings)
+  parse_voltage_dividers(cfg, root);
+
   // --- Compute (preset + mpi/threads/device) with precedence & back-compat
   parse_compute(cfg, root);
 
@@ -1,6 +1,7 @@
 #pragma once
 #include <string>
 #include <unordered_map>
+#include <vector>
 
 // FIXME REMOVE THE DEFAULTS
 // TODO Remove defaults - fix documentation  
@@ -8,7 +9,13 @@
 struct Boundary {
     int bdr_id = -1;        // bdr_id
     std::string type;       // "dirichlet" | "neumann" | "robin"
-    double value = 0.0;
+    double value = 0.0;     // robin: far-field potential
+
+    // robin: eps*dphi/dn + alpha*(phi - value) = 0
+    std::string model = "asymptotic";   // "asymptotic" (open boundary) | "constant"
+    double alpha = 0.0;                 // constant model
+    std::vector<double> center;         // asymptotic: origin of the far field, default 0
+    int decay = 1;                      // asymptotic: phi ~ r^-decay (1: 3D/axisym charge, 2D dipole)
 };
 
 struct Material {
@@ -55,8 +62,46 @@ struct DebugSettings {
 
 struct MeshSettings {
     std::string path = "geometry.msh";
+    // Locality reordering after load (cache-friendlier assembly, SpMV and postprocessing)
+    std::string element_order = "none"; // "none" | "hilbert" (space-filling curve, renumbers vertices and dofs too)
+};
+
+
+// Axisymmetric (r,z) solution revolved into 3D for consumers that expect 3D fields
+struct RevolveSettings {
+    std::string path;           // "" -> disabled, else CSV "x,y,z,V,Ex,Ey,Ez"
+    std::string mode = "points";// "points" (mesh vertices x n_theta) | "grid" (regular xyz grid)
+    int n_theta = 36;           // points mode: angular samples
+    int nx = 50, ny = 50, nz = 50; // grid mode: samples per axis over the revolved bounding box
+};
+
+// Previous design (mesh + V) interpolated onto the current mesh as the initial guess
+struct WarmStartSettings {
+    std::string mesh;           // "" -> cold start from zero
+    std::string solution;       // e.g. a previous run's solution_V.gf
 };
 
+// Mirror symmetry: the mesh only covers x >= 0 and/or y >= 0, the cut planes are
+// homogeneous Neumann (never Dirichlet) and exports are reflected to the full domain
+struct SymmetrySettings {
+    bool x = false;             // mirrored across the x = 0 plane
+    bool y = false;             // mirrored across the y = 0 plane
+    int  x_bdr_id = -1;         // boundary attribute of the x = 0 cut
+    int  y_bdr_id = -1;         // boundary attribute of the y = 0 cut
+    std::string path;           // "" -> no export, else CSV "x,y,z,V,Ex,Ey,Ez" of all mirror images
+};
+
+// Goal-oriented stopping: CG stops once the quantities of interest stop changing
+struct GoalSettings {
+    int    every  = 0;          // check every k CG iterations, 0 -> off (residual tolerances only)
+    double rtol   = 1e-4;       // relative change allowed between two checks
+    int    window = 2;          // consecutive stable checks required
+    std::vector<std::vector<double>> probes;   // E at these points
+    std::vector<int> regions;   // field energy in these volume attributes
+    std::vector<int> charges;   // charge (/eps0) on these electrode bdr_ids
+    bool   energy = false;      // energy-norm decrease between checks (one extra pass over all elements)
+    std::string history;        // optional CSV of every check
+};
 
 // -------------------- Compute / Runtime Settings ----------------------------
 struct SolverSettings {
@@ -67,16 +112,28 @@ struct SolverSettings {
     std::string assembly_mode = "partial";
     std::string solver = "pcg";
     std::string precond = "bommerang"; 
+    // Opt-in: partial assembly + Jacobi instead of the assembled matrix + BoomerAMG/DSmoother
+    bool partial_assembly = false;
 
     double atol = 1.0;
     double rtol = 0.0;
     int    maxiter = 100000;
     int    printlevel = 1;
 
+    // Mixed precision (serial only): float inner solve wrapped in double iterative refinement
+    bool   mixed_precision     = false;
+    double mixed_inner_rtol    = 1e-3;
+    int    mixed_inner_maxiter = 1000;
+    int    mixed_max_refine    = 50;
+
     // Outputs
     std::string mesh_save_path   = "simulation_mesh.msh";
     std::string V_solution_path  = "solution_V.gf";
     std::string Emag_solution_path = "solution_Emag.gf";
+    RevolveSettings revolve;
+    WarmStartSettings warm_start;
+    GoalSettings goal;
+    SymmetrySettings symmetry;
 };
 
 struct Config {
@@ -0,0 +1,151 @@
+#include "element_locator.h"
+
+#include <algorithm>
+#include <cmath>
+#include <limits>
+
+using namespace mfem;
+
+ElementLocator::ElementLocator(Mesh &mesh)
+  : mesh_(mesh), sdim_(mesh.SpaceDimension())
+{
+  const int ne = mesh.GetNE();
+  box_lo_.resize(static_cast<size_t>(ne) * sdim_);
+  box_hi_.resize(static_cast<size_t>(ne) * sdim_);
+  lo_.assign(sdim_, std::numeric_limits<double>::max());
+  hi_.assign(sdim_, std::numeric_limits<double>::lowest());
+
+  Array<int> v;
+  for (int e = 0; e < ne; ++e)
+  {
+    mesh.GetElementVertices(e, v);
+    double *blo = &box_lo_[static_cast<size_t>(e) * sdim_];
+    double *bhi = &box_hi_[static_cast<size_t>(e) * sdim_];
+    for (int d = 0; d < sdim_; ++d) { blo[d] = std::numeric_limits<double>::max(); bhi[d] = std::numeric_limits<double>::lowest(); }
+    for (int k = 0; k < v.Size(); ++k)
+    {
+      const double *X = mesh.GetVertex(v[k]);
+      for (int d = 0; d < sdim_; ++d) { blo[d] = std::min(blo[d], X[d]); bhi[d] = std::max(bhi[d], X[d]); }
+    }
+    for (int d = 0; d < sdim_; ++d)
+    {
+      const double pad = 0.05 * (bhi[d] - blo[d]);   // curved (high order) elements bulge a little
+      blo[d] -= pad; bhi[d] += pad;
+      lo_[d] = std::min(lo_[d], blo[d]); hi_[d] = std::max(hi_[d], bhi[d]);
+    }
+  }
+
+  // ~1 element per cell
+  double diag2 = 0.0;
+  n_.assign(sdim_, 1);
+  const int per_axis = std::max(1, static_cast<int>(std::ceil(std::pow(std::max(ne, 1), 1.0 / sdim_))));
+  for (int d = 0; d < sdim_; ++d)
+  {
+    n_[d] = per_axis;
+    h_.push_back(std::max(hi_[d] - lo_[d], 1e-300) / per_axis);
+    diag2 += (hi_[d] - lo_[d]) * (hi_[d] - lo_[d]);
+  }
+  tol_ = 1e-8 * std::sqrt(diag2);
+
+  // CSR cell -> elements
+  size_t ncells = 1;
+  for (int d = 0; d < sdim_; ++d) ncells *= n_[d];
+  start_.assign(ncells + 1, 0);
+  for (int pass = 0; pass < 2; ++pass)
+  {
+    std::vector<int> fill;
+    if (pass == 1)
+    {
+      for (size_t c = 0; c < ncells; ++c) start_[c + 1] += start_[c];
+      elems_.resize(start_[ncells]);
+      fill.assign(start_.begin(), start_.end() - 1);
+    }
+    for (int e = 0; e < ne; ++e)
+    {
+      int c0[3] = {0, 0, 0}, c1[3] = {0, 0, 0};
+      for (int d = 0; d < sdim_; ++d)
+      {
+        c0[d] = Cell(d, box_lo_[static_cast<size_t>(e) * sdim_ + d]);
+        c1[d] = Cell(d, box_hi_[static_cast<size_t>(e) * sdim_ + d]);
+      }
+      for (int k = c0[2]; k <= c1[2]; ++k)
+        for (int j = c0[1]; j <= c1[1]; ++j)
+          for (int i = c0[0]; i <= c1[0]; ++i)
+          {
+            const size_t c = Index(i, j, k);
+            if (pass == 0) ++start_[c + 1];
+            else           elems_[fill[c]++] = e;
+          }
+    }
+  }
+}
+
+int ElementLocator::Locate(const Vector &x, IntegrationPoint &ip)
+{
+  int c[3] = {0, 0, 0};
+  for (int d = 0; d < sdim_; ++d)
+  {
+    if (x(d) < lo_[d] || x(d) > hi_[d]) return -1;
+    c[d] = Cell(d, x(d));
+  }
+  const size_t cell = Index(c[0], c[1], c[2]);
+
+  // Inside wins; otherwise the candidate whose mapped point lands closest (points on
+  // faces/within roundoff of the boundary) if it is within tol_
+  int best = -1;
+  double best_dist = tol_;
+  IntegrationPoint cand;
+  for (int k = start_[cell]; k < start_[cell + 1]; ++k)
+  {
+    const int e = elems_[k];
+    if (!InBox(e, x)) continue;
+    mesh_.GetElementTransformation(e, &T_);
+    inv_.SetTransformation(T_);
+    const int res = inv_.Transform(x, cand);
+    if (res == InverseElementTransformation::Inside) { ip = cand; return e; }
+
+    T_.Transform(cand, y_);
+    y_ -= x;
+    const double dist = y_.Norml2();
+    if (dist <= best_dist) { best = e; best_dist = dist; ip = cand; }
+  }
+  return best;
+}
+
+void ElementLocator::FindPoints(const DenseMatrix &pts, Array<int> &elem_ids,
+                                Array<IntegrationPoint> &ips)
+{
+  MFEM_VERIFY(pts.Height() == sdim_, "ElementLocator: points must have sdim rows.");
+  const int n = pts.Width();
+  elem_ids.SetSize(n);
+  ips.SetSize(n);
+  Vector x(sdim_);
+  for (int i = 0; i < n; ++i)
+  {
+    for (int d = 0; d < sdim_; ++d) x(d) = pts(d, i);
+    elem_ids[i] = Locate(x, ips[i]);
+  }
+}
+
+int ElementLocator::Cell(int d, double x) const
+{
+  const int c = static_cast<int>((x - lo_[d]) / h_[d]);
+  return std::min(std::max(c, 0), n_[d] - 1);
+}
+
+size_t ElementLocator::Index(int i, int j, int k) const
+{
+  return static_cast<size_t>(i)
+       + static_cast<size_t>(n_[0]) * (static_cast<size_t>(j)
+       + static_cast<size_t>(sdim_ > 1 ? n_[1] : 1) * static_cast<size_t>(k));
+}
+
+bool ElementLocator::InBox(int e, const Vector &x) const
+{
+  for (int d = 0; d < sdim_; ++d)
+  {
+    if (x(d) < box_lo_[static_cast<size_t>(e) * sdim_ + d] ||
+        x(d) > box_hi_[static_cast<size_t>(e) * sdim_ + d]) return false;
+  }
+  return true;
+}
@@ -0,0 +1,41 @@
+#pragma once
+#ifndef ELEMENT_LOCATOR_H
+#define ELEMENT_LOCATOR_H
+
+#include "mfem.hpp"
+#include <vector>
+
+// Uniform grid of element bounding boxes: candidates for a point are the elements
+// binned into its cell, so locating N points costs ~O(N) instead of the
+// O(N x NE) element-center scan of Mesh::FindPoints. Serial, local elements only.
+class ElementLocator
+{
+public:
+  explicit ElementLocator(mfem::Mesh &mesh);
+
+  // Element containing x (-1 if none), ip its reference coordinates
+  int Locate(const mfem::Vector &x, mfem::IntegrationPoint &ip);
+
+  // Drop-in for Mesh::FindPoints: pts is (sdim x N), elem_ids -1 outside the mesh
+  void FindPoints(const mfem::DenseMatrix &pts, mfem::Array<int> &elem_ids,
+                  mfem::Array<mfem::IntegrationPoint> &ips);
+
+private:
+  int    Cell(int d, double x) const;
+  size_t Index(int i, int j, int k) const;
+  bool   InBox(int e, const mfem::Vector &x) const;
+
+  mfem::Mesh         &mesh_;
+  int                 sdim_;
+  std::vector<double> box_lo_, box_hi_;   // per element, padded
+  std::vector<double> lo_, hi_, h_;       // grid
+  std::vector<int>    n_;
+  std::vector<int>    start_, elems_;     // CSR cell -> elements
+  double              tol_ = 0.0;
+
+  mfem::IsoparametricTransformation  T_;
+  mfem::InverseElementTransformation inv_;
+  mfem::Vector                       y_;
+};
+
+#endif // ELEMENT_LOCATOR_H
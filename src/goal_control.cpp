@@ -0,0 +1,253 @@
+#include "goal_control.h"
+
+#include <algorithm>
+#include <cmath>
+#include <fstream>
+#include <iostream>
+
+using namespace mfem;
+
+GoalOrientedController::GoalOrientedController(FiniteElementSpace &fes,
+                                               Coefficient &eps,
+                                               const SolverSettings &s)
+  : fes_(fes), eps_(eps), goal_(s.goal), axisym_(s.axisymmetric), V_(&fes)
+{
+#ifdef MFEM_USE_MPI
+  if (auto *pfes = dynamic_cast<ParFiniteElementSpace*>(&fes))
+  {
+    par_  = true;
+    comm_ = pfes->GetComm();
+  }
+#endif
+  Mesh &mesh = *fes.GetMesh();
+  const int sdim = mesh.SpaceDimension();
+
+  // Probe points are located once; in parallel only the owning rank(s) find them
+  if (!goal_.probes.empty())
+  {
+    DenseMatrix pts(sdim, static_cast<int>(goal_.probes.size()));
+    pts = 0.0;
+    for (size_t i = 0; i < goal_.probes.size(); ++i)
+    {
+      MFEM_VERIFY(static_cast<int>(goal_.probes[i].size()) == sdim,
+                  "goal.probes: every point needs " << sdim << " coordinates.");
+      for (int d = 0; d < sdim; ++d) pts(d, static_cast<int>(i)) = goal_.probes[i][d];
+    }
+    mesh.FindPoints(pts, probe_elem_, probe_ip_, /*warn=*/false);
+    for (size_t i = 0; i < goal_.probes.size(); ++i)
+    {
+      if (Sum(probe_elem_[static_cast<int>(i)] >= 0 ? 1.0 : 0.0) == 0.0)
+        std::cerr << "\033[33m" << "WARNING: goal probe " << i << " is outside the mesh" << "\033[0m\n";
+      for (int d = 0; d < sdim; ++d)
+        names_.push_back("E" + std::string(1, "xyz"[d]) + "_p" + std::to_string(i));
+    }
+  }
+  for (int r : goal_.regions) names_.push_back("W_" + std::to_string(r));
+  for (int c : goal_.charges) names_.push_back("Q_" + std::to_string(c));
+}
+
+int GoalOrientedController::Rank() const
+{
+  int rank = 0;
+#ifdef MFEM_USE_MPI
+  if (par_) MPI_Comm_rank(comm_, &rank);
+#endif
+  return rank;
+}
+
+double GoalOrientedController::Sum(double v) const
+{
+#ifdef MFEM_USE_MPI
+  if (par_) { double g = 0.0; MPI_Allreduce(&v, &g, 1, MPI_DOUBLE, MPI_SUM, comm_); return g; }
+#endif
+  return v;
+}
+
+void GoalOrientedController::SetSystem(const Operator &A, const Vector &B)
+{
+  A_ = &A;
+  B_ = &B;
+  q_prev_.clear();
+  have_prev_ = false;
+  stable_    = 0;
+  converged_ = false;
+  history_.clear();
+}
+
+double GoalOrientedController::Energy(const std::vector<int> *attrs) const
+{
+  Mesh &mesh = *fes_.GetMesh();
+  Vector grad, X;
+  double W = 0.0;
+  for (int e = 0; e < mesh.GetNE(); ++e)
+  {
+    if (attrs && std::find(attrs->begin(), attrs->end(), mesh.GetAttribute(e)) == attrs->end()) continue;
+    ElementTransformation *T = mesh.GetElementTransformation(e);
+    const IntegrationRule &ir = IntRules.Get(mesh.GetElementBaseGeometry(e),
+                                             2 * fes_.GetFE(e)->GetOrder() + T->OrderW());
+    for (int i = 0; i < ir.GetNPoints(); ++i)
+    {
+      const IntegrationPoint &ip = ir.IntPoint(i);
+      T->SetIntPoint(&ip);
+      V_.GetGradient(*T, grad);
+      double w = ip.weight * T->Weight() * eps_.Eval(*T, ip);
+      if (axisym_) { T->Transform(ip, X); w *= 2.0 * M_PI * std::max(X(0), 0.0); }
+      W += 0.5 * w * (grad * grad);
+    }
+  }
+  return Sum(W);
+}
+
+double GoalOrientedController::Charge(int bdr_id) const
+{
+  // Q/eps0 = int eps_r grad V . n over the electrode surface (n out of the domain)
+  Mesh &mesh = *fes_.GetMesh();
+  Vector grad, nor(mesh.SpaceDimension()), X;
+  double Q = 0.0;
+  for (int be = 0; be < mesh.GetNBE(); ++be)
+  {
+    if (mesh.GetBdrAttribute(be) != bdr_id) continue;
+    FaceElementTransformations *FT = mesh.GetBdrFaceTransformations(be);
+    if (!FT) continue;
+    ElementTransformation &T1 = FT->GetElement1Transformation();
+    const IntegrationRule &ir = IntRules.Get(FT->GetGeometryType(),
+                                             2 * fes_.GetFE(FT->Elem1No)->GetOrder());
+    for (int i = 0; i < ir.GetNPoints(); ++i)
+    {
+      const IntegrationPoint &ip = ir.IntPoint(i);
+      FT->SetAllIntPoints(&ip);
+      V_.GetGradient(T1, grad);
+      CalcOrtho(FT->Jacobian(), nor);              // |nor| = surface measure
+      double w = ip.weight * eps_.Eval(T1, T1.GetIntPoint());
+      if (axisym_) { FT->Transform(ip, X); w *= 2.0 * M_PI * std::max(X(0), 0.0); }
+      Q += w * (grad * nor);
+    }
+  }
+  return Sum(Q);
+}
+
+void GoalOrientedController::Evaluate(const Vector &x, std::vector<double> &q, double &W, double &J)
+{
+  // True dofs -> local dofs (NC / parallel spaces have a prolongation)
+  if (const Operator *P = fes_.GetProlongationMatrix()) P->Mult(x, V_);
+  else V_ = x;
+
+  q.clear();
+  Mesh &mesh = *fes_.GetMesh();
+  const int sdim = mesh.SpaceDimension();
+  Vector grad(sdim);
+  for (int i = 0; i < probe_elem_.Size(); ++i)
+  {
+    // Points on rank interfaces are found twice: average
+    grad = 0.0;
+    double found = 0.0;
+    if (probe_elem_[i] >= 0)
+    {
+      ElementTransformation *T = mesh.GetElementTransformation(probe_elem_[i]);
+      T->SetIntPoint(&probe_ip_[i]);
+      V_.GetGradient(*T, grad);
+      found = 1.0;
+    }
+    found = std::max(Sum(found), 1.0);
+    for (int d = 0; d < sdim; ++d) q.push_back(-Sum(grad(d)) / found);
+  }
+  for (int r : goal_.regions) { std::vector<int> one{r}; q.push_back(Energy(&one)); }
+  for (int c : goal_.charges) q.push_back(Charge(c));
+
+  W = J = 0.0;
+  if (goal_.energy && A_ && B_)
+  {
+    // J(x) = 1/2 x.Ax - b.x decreases monotonically in CG, J_k - J* = 1/2 ||e_k||_A^2
+    Vector Ax(x.Size());
+    A_->Mult(x, Ax);
+#ifdef MFEM_USE_MPI
+    if (par_) J = 0.5 * InnerProduct(comm_, x, Ax) - InnerProduct(comm_, *B_, x);
+    else
+#endif
+    J = 0.5 * (x * Ax) - (*B_ * x);
+    W = Energy(nullptr);
+  }
+}
+
+void GoalOrientedController::MonitorSolution(int it, real_t norm, const Vector &x, bool final)
+{
+  if (final || goal_.every <= 0 || it == 0 || it % goal_.every != 0) return;
+
+  std::vector<double> q;
+  double W = 0.0, J = 0.0;
+  Evaluate(x, q, W, J);
+
+  // Largest relative change over all quantities; probe components are scaled by
+  // the probe's |E| so near-zero components do not block convergence
+  double change = 0.0, energy_drop = -1.0;
+  if (have_prev_)
+  {
+    const int sdim = fes_.GetMesh()->SpaceDimension();
+    const int n_probe = probe_elem_.Size() * sdim;
+    for (size_t i = 0; i < q.size(); ++i)
+    {
+      double scale = std::abs(q[i]);
+      if (static_cast<int>(i) < n_probe)
+      {
+        const size_t p0 = (i / sdim) * sdim;
+        scale = 0.0;
+        for (int d = 0; d < sdim; ++d) scale += q[p0 + d] * q[p0 + d];
+        scale = std::sqrt(scale);
+      }
+      const double dq = std::abs(q[i] - q_prev_[i]);
+      change = std::max(change, scale > 0.0 ? dq / scale : (dq > 0.0 ? 1.0 : 0.0));
+    }
+    if (goal_.energy && W > 0.0)
+    {
+      // Relative energy-norm decrease between checks. Only a lower bound on the error
+      // of the previous check (||e_prev||_A / ||u||_A >= this), a stagnation measure like q
+      energy_drop = std::sqrt(std::max(J_prev_ - J, 0.0) / W);
+      change = std::max(change, energy_drop);
+    }
+    stable_ = (change <= goal_.rtol) ? stable_ + 1 : 0;
+    converged_ = stable_ >= std::max(goal_.window, 1);
+  }
+
+  std::vector<double> row{static_cast<double>(it), norm};
+  row.insert(row.end(), q.begin(), q.end());
+  row.push_back(energy_drop);
+  history_.push_back(std::move(row));
+
+  if (Rank() == 0)
+  {
+    std::cout << "[Goal] it " << it << "  ||r|| " << norm;
+    if (have_prev_) std::cout << "  max rel change " << change;
+    if (energy_drop >= 0.0) std::cout << "  energy decrease " << energy_drop;
+    std::cout << (converged_ ? "  -> converged" : "") << "\n";
+  }
+
+  q_prev_ = std::move(q);
+  J_prev_ = J;
+  have_prev_ = true;
+}
+
+void GoalOrientedController::Finish(int iterations)
+{
+  if (Rank() != 0) return;
+
+  std::cout << "[Goal] " << (converged_ ? "quantities of interest stable" : "stopped by residual/maxiter")
+            << " after " << iterations << " iterations (" << history_.size() << " checks)\n";
+  if (!history_.empty() && !q_prev_.empty())
+  {
+    for (size_t i = 0; i < names_.size(); ++i)
+      std::cout << "[Goal]   " << names_[i] << " = " << q_prev_[i] << "\n";
+  }
+
+  if (goal_.history.empty()) return;
+  std::ofstream out(goal_.history);
+  if (!out) { std::cerr << "[Goal] cannot write " << goal_.history << "\n"; return; }
+  out.precision(12);
+  out << "it,residual";
+  for (const auto &n : names_) out << "," << n;
+  out << ",energy_drop\n";
+  for (const auto &row : history_)
+  {
+    for (size_t i = 0; i < row.size(); ++i) out << (i ? "," : "") << row[i];
+    out << "\n";
+  }
+}
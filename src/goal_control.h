@@ -0,0 +1,64 @@
+#pragma once
+#ifndef GOAL_CONTROL_H
+#define GOAL_CONTROL_H
+
+#include "mfem.hpp"
+#include "config/Config.h"
+#include <string>
+#include <vector>
+
+// CG controller that stops once quantities of interest are stable instead of
+// relying on residual tolerances alone. Every `goal.every` iterations it evaluates
+//   - E = -grad V at probe points,
+//   - field energy 1/2 int eps |grad V|^2 in volume regions,
+//   - charge / eps0 = int eps grad V . n on electrode boundaries,
+//   - the relative energy-norm decrease sqrt((J_prev - J) / W) of J(x) = 1/2 x.Ax - b.x
+//     between checks (a lower bound on the error, not an estimate of it),
+// and reports convergence after `goal.window` consecutive checks that changed by
+// less than `goal.rtol`. Every check is logged ([Goal], optional CSV).
+class GoalOrientedController : public mfem::IterativeSolverController
+{
+public:
+  GoalOrientedController(mfem::FiniteElementSpace &fes,
+                         mfem::Coefficient &eps,
+                         const SolverSettings &s);
+
+  // Call before each solve: operator and RHS of the (eliminated) true-dof system
+  void SetSystem(const mfem::Operator &A, const mfem::Vector &B);
+  // Call after each solve: summary line and history CSV
+  void Finish(int iterations);
+
+  void MonitorSolution(int it, mfem::real_t norm, const mfem::Vector &x, bool final) override;
+  bool RequiresUpdatedSolution() const override { return true; }
+  bool HasConverged() override { return converged_; }
+
+private:
+  void   Evaluate(const mfem::Vector &x, std::vector<double> &q, double &W, double &J);
+  double Energy(const std::vector<int> *attrs) const;   // nullptr -> all elements
+  double Charge(int bdr_id) const;
+  double Sum(double v) const;                            // over ranks
+  int    Rank() const;
+
+  mfem::FiniteElementSpace &fes_;
+  mfem::Coefficient        &eps_;
+  const GoalSettings        goal_;
+  bool                      axisym_;
+  bool                      par_ = false;
+  MPI_Comm                  comm_ = MPI_COMM_SELF;
+
+  mfem::GridFunction             V_;       // x prolongated to local dofs
+  mfem::Array<int>               probe_elem_;
+  mfem::Array<mfem::IntegrationPoint> probe_ip_;
+  const mfem::Operator          *A_ = nullptr;
+  const mfem::Vector            *B_ = nullptr;
+
+  std::vector<std::string>         names_;
+  std::vector<double>              q_prev_;
+  double                           J_prev_ = 0.0;
+  bool                             have_prev_ = false;
+  int                              stable_ = 0;
+  bool                             converged_ = false;
+  std::vector<std::vector<double>> history_;  // it, ||r||, q..., energy decrease
+};
+
+#endif // GOAL_CONTROL_H
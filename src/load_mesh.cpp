@@ -3,19 +3,53 @@
 #include <iostream>
 #include <cmath>
 
+// Mean (max - min) index over the vertices/dofs of each element: small = good locality
+static double MeanElementVertexSpan(const mfem::Mesh &mesh)
+{
+  mfem::Array<int> v;
+  double sum = 0.0;
+  for (int e = 0; e < mesh.GetNE(); ++e)
+  {
+    mesh.GetElementVertices(e, v);
+    sum += v.Max() - v.Min();
+  }
+  return mesh.GetNE() ? sum / mesh.GetNE() : 0.0;
+}
+
 std::unique_ptr<mfem::Mesh>
 CreateSimulationDomain(const std::string &path, bool use_distributed,
 #ifdef MFEM_USE_MPI
-                       MPI_Comm comm
+                       MPI_Comm comm,
 #else
-                       int /*comm*/
+                       int /*comm*/,
 #endif
+                       const std::string &element_order
 ) {
   // Load Mesh 
   auto serial = std::make_unique<mfem::Mesh>(path.c_str());
   if (serial->bdr_attributes.Size() == 0) { 
     std::cerr << "No boundary attributes!\n"; std::exit(1); 
   }
+  // Hilbert order has to happen on the serial conforming mesh (ReorderElements
+  // refuses NC meshes) and before partitioning
+  if (element_order == "hilbert")
+  {
+    mfem::StopWatch t;
+    t.Start();
+    const double span0 = MeanElementVertexSpan(*serial);
+    mfem::Array<int> ordering;
+    serial->GetHilbertElementOrdering(ordering);
+    serial->ReorderElements(ordering);
+    t.Stop();
+    std::cout << "[Mesh] Hilbert element order: mean vertex span per element "
+              << span0 << " -> " << MeanElementVertexSpan(*serial)
+              << " (" << t.RealTime() << " s)\n";
+  }
+  else if (element_order != "none")
+  {
+    std::cerr << "\033[33m" << "WARNING: unknown mesh.element_order '" << element_order
+              << "', keeping the generator order" << "\033[0m\n";
+  }
   serial->EnsureNCMesh();
   // Parallelize if required
   #ifdef MFEM_USE_MPI
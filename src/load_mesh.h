@@ -10,10 +10,11 @@ std::unique_ptr<mfem::Mesh>
 CreateSimulationDomain(const std::string &path,
                        bool use_distributed,
 #ifdef MFEM_USE_MPI
-                       MPI_Comm comm = MPI_COMM_WORLD
+                       MPI_Comm comm = MPI_COMM_WORLD,
 #else
-                       int comm = 0   // ignored when MPI is off
+                       int comm = 0,  // ignored when MPI is off
 #endif
+                       const std::string &element_order = "none"  // "none" | "hilbert"
 );
 
 void CheckAxisymmetricMesh( const mfem::Mesh &mesh,
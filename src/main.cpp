@@ -4,6 +4,8 @@
 #include "boundary_conditions.h"
 #include "solver.h"
 #include "ComputeElectricField.h"
+#include "solver_service.h"
+#include "warm_start.h"
 #include "config/Config.h"
 #include "cmdLineParser.h"
 
@@ -57,6 +59,10 @@ int main(int argc, char *argv[])
       return 1;
   }
 
+  // optional: keep running as a solver service on a local socket
+  auto serve_opt = args.get("-s");
+  if (!serve_opt) serve_opt = args.get("--serve");
+
   // Log and continue 
   std::cout << "[Config] " << config_path << "\n";
   std::cout << "[Mesh]   " << model_path  << "\n";
@@ -121,7 +127,7 @@ int main(int argc, char *argv[])
 
  
   // 1. Create the mesh
-  auto mesh = CreateSimulationDomain(model_path, use_distributed, comm); 
+  auto mesh = CreateSimulationDomain(model_path, use_distributed, comm, cfg->mesh.element_order);
   if (cfg->solver.axisymmetric) {
     if (mesh->Dimension() != 2) { std::cerr << "Axisymmetric Simulation Geometry 3D" << std::endl;  }
     // Check r axis starts at null
@@ -139,8 +145,22 @@ int main(int argc, char *argv[])
   // FIXME: For Neumann and Robin and axisymmetric we still need to supply boundary markers
 
 
-  // 4. Solve Poisson
-  auto V = SolvePoisson(fespace, dirichlet_arr, cfg);
+  // Service mode: operator + preconditioner stay resident, requests over the socket
+  if (serve_opt) {
+    if (use_distributed) {
+      std::cerr << "Error: --serve is serial only, disable compute.mpi\n";
+      return 1;
+    }
+    SolverService service(fespace, dirichlet_arr, cfg);
+    return service.Run(*serve_opt);
+  }
+
+  // 4. Solve Poisson (optionally seeded with a previous design's solution)
+  std::unique_ptr<GridFunction> V0;
+  const auto &ws = cfg->solver.warm_start;
+  if (!ws.mesh.empty() && !ws.solution.empty())
+    V0 = TransferSolution(fespace, ws.mesh, ws.solution);
+  auto V = SolvePoisson(fespace, dirichlet_arr, cfg, V0.get());
 
   // Pick classes based on parallelization
   std::unique_ptr<mfem::FiniteElementSpace> vec_fes, scalar_fes;
@@ -170,6 +190,21 @@ int main(int argc, char *argv[])
   SaveEComponents(*E, "field");          // field_ex.gf, field_ey.gf, (field_ez.gf)
   { std::ofstream ofs("field_mag.gf"); Emag->Save(ofs); }
 
+  // Optional: revolve the axisymmetric (r,z) result into 3D
+  const auto &rev = cfg->solver.revolve;
+  if (cfg->solver.axisymmetric && !rev.path.empty()) {
+    if (rev.mode == "grid") SaveRevolvedGrid(*V, *E, rev.path, rev.nx, rev.ny, rev.nz);
+    else                    SaveRevolvedPoints(*V, *E, rev.path, rev.n_theta);
+    std::cout << "[Axisym] revolved field written to " << rev.path << "\n";
+  }
+
+  // Optional: reflect a symmetry-reduced result back into the full domain
+  const auto &sym = cfg->solver.symmetry;
+  if ((sym.x || sym.y) && !sym.path.empty()) {
+    SaveMirroredPoints(*V, *E, sym.path, sym.x, sym.y);
+    std::cout << "[Symmetry] mirrored field written to " << sym.path << "\n";
+  }
+
   // 5. Save Data
   mesh->Save(cfg->solver.mesh_save_path.c_str());
   V->Save(cfg->solver.V_solution_path.c_str());
@@ -0,0 +1,148 @@
+#include "mixed_precision.h"
+#include <algorithm>
+#include <cmath>
+#include <iostream>
+
+using namespace mfem;
+
+// -------------------- SinglePrecisionSparseMatrix ----------------------------
+
+SinglePrecisionSparseMatrix::SinglePrecisionSparseMatrix(const SparseMatrix &A)
+  : Operator(A.Height(), A.Width())
+{
+  MFEM_VERIFY(A.Finalized(), "SinglePrecisionSparseMatrix: matrix must be finalized.");
+  const int  n   = A.Height();
+  const int  nnz = A.NumNonZeroElems();
+  const int    *Ai = A.GetI();
+  const int    *Aj = A.GetJ();
+  const double *Ad = A.GetData();
+
+  I_.SetSize(n + 1);
+  J_.SetSize(nnz);
+  A_.resize(nnz);
+  for (int i = 0; i <= n; ++i) I_[i] = Ai[i];
+  for (int k = 0; k < nnz; ++k)
+  {
+    J_[k] = Aj[k];
+    A_[k] = static_cast<float>(Ad[k]);
+  }
+}
+
+void SinglePrecisionSparseMatrix::Mult(const Vector &x, Vector &y) const
+{
+  const double *xp = x.HostRead();
+  double       *yp = y.HostWrite();
+  const int    *Ip = I_.GetData();
+  const int    *Jp = J_.GetData();
+  const float  *Ap = A_.data();
+
+  #pragma omp parallel for
+  for (int i = 0; i < height; ++i)
+  {
+    double s = 0.0;
+    for (int k = Ip[i]; k < Ip[i + 1]; ++k) { s += Ap[k] * xp[Jp[k]]; }
+    yp[i] = s;
+  }
+}
+
+size_t SinglePrecisionSparseMatrix::MemoryBytes() const
+{
+  return A_.size() * sizeof(float)
+       + static_cast<size_t>(J_.Size() + I_.Size()) * sizeof(int);
+}
+
+// -------------------- SinglePrecisionJacobi ---------------------------------
+
+SinglePrecisionJacobi::SinglePrecisionJacobi(const SinglePrecisionSparseMatrix &A)
+  : Solver(A.Height(), A.Width())
+{
+  const auto &I = A.RowPtr();
+  const auto &J = A.ColInd();
+  const auto &D = A.Data();
+
+  inv_diag_.assign(height, 1.0f);
+  for (int i = 0; i < height; ++i)
+  {
+    for (int k = I[i]; k < I[i + 1]; ++k)
+    {
+      if (J[k] == i && D[k] != 0.0f) { inv_diag_[i] = 1.0f / D[k]; break; }
+    }
+  }
+}
+
+void SinglePrecisionJacobi::Mult(const Vector &x, Vector &y) const
+{
+  const double *xp = x.HostRead();
+  double       *yp = y.HostWrite();
+  const float  *dp = inv_diag_.data();
+
+  #pragma omp parallel for
+  for (int i = 0; i < height; ++i) { yp[i] = dp[i] * xp[i]; }
+}
+
+// -------------------- Iterative refinement ----------------------------------
+
+MixedPrecisionSolver::MixedPrecisionSolver(OperatorHandle &A, const SolverSettings &s)
+  : Solver(A->Height(), A->Width()), A_(A.Ptr()), s_(s)
+{
+  auto *As = A.As<SparseMatrix>();
+  MFEM_VERIFY(As, "MixedPrecisionSolver: expected an assembled serial SparseMatrix.");
+  auto Af  = std::make_unique<SinglePrecisionSparseMatrix>(*As);
+  P_inner_ = std::make_unique<SinglePrecisionJacobi>(*Af);
+  // The double matrix is kept for the outer residual: the float copy is extra memory,
+  // the gain is the inner SpMV streaming 8 instead of 12 bytes per nonzero
+  std::cout << "[Mixed] float copy " << Af->MemoryBytes() / (1024.0 * 1024.0)
+            << " MiB in addition to the double operator "
+            << (As->NumNonZeroElems() * (sizeof(double) + sizeof(int))
+                + (As->Height() + 1) * sizeof(int)) / (1024.0 * 1024.0)
+            << " MiB (inner SpMV traffic ~2/3 of double)\n";
+  A_inner_owned_ = std::move(Af);
+
+  inner_ = std::make_unique<CGSolver>();
+  inner_->SetOperator(*A_inner_owned_);
+  inner_->SetPreconditioner(*P_inner_);
+  inner_->SetRelTol(s_.mixed_inner_rtol);
+  inner_->SetAbsTol(0.0);
+  inner_->SetMaxIter(s_.mixed_inner_maxiter);
+  inner_->SetPrintLevel(0);
+  inner_->iterative_mode = false;
+}
+
+void MixedPrecisionSolver::Mult(const Vector &B, Vector &X) const
+{
+  // Outer loop: residual and update always in double. Stops on sqrt(r.Pr) with the
+  // Jacobi P, the same preconditioned norm CGSolver (DSmoother) applies rtol/atol to
+  Vector r(B.Size()), d(B.Size()), z(B.Size());
+  auto pnorm = [&]() { P_inner_->Mult(r, z); return std::sqrt(std::max(InnerProduct(r, z), 0.0)); };
+  A_->Mult(X, r);
+  subtract(B, r, r);
+
+  const double r0  = pnorm();
+  const double tol = std::max(s_.rtol * r0, s_.atol);
+  double rnorm = r0;
+  total_its_ = 0;
+
+  for (int k = 0; k < s_.mixed_max_refine && rnorm > tol; ++k)
+  {
+    inner_->Mult(r, d);
+    total_its_ += inner_->GetNumIterations();
+    X += d;
+
+    A_->Mult(X, r);
+    subtract(B, r, r);
+    rnorm = pnorm();
+
+    if (s_.printlevel > 0)
+    {
+      std::cout << "[Mixed] refinement " << k + 1
+                << "  inner its " << inner_->GetNumIterations()
+                << "  sqrt(r.Pr) = " << rnorm << "\n";
+    }
+  }
+
+  if (rnorm > tol)
+  {
+    std::cerr << "\033[33m" << "WARNING: mixed-precision solve did not converge, sqrt(r.Pr) = "
+              << rnorm << " > " << tol << "\033[0m\n";
+  }
+}
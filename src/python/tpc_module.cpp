@@ -0,0 +1,309 @@
+// Python bindings: results are NumPy views on MFEM memory (no copies)
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <pybind11/stl.h>
+
+#include <limits>
+#include <stdexcept>
+
+#include "mfem.hpp"
+#include "config/Config.h"
+#include "load_mesh.h"
+#include "boundary_conditions.h"
+#include "solver.h"
+#include "ComputeElectricField.h"
+#include "warm_start.h"
+#include "element_locator.h"
+
+namespace py = pybind11;
+using namespace mfem;
+
+namespace {
+
+// Everything a solve needs, owned together (the Mesh is kept alive by Python)
+struct Domain
+{
+  std::shared_ptr<const Config>       cfg;
+  Mesh                               *mesh = nullptr;
+  std::unique_ptr<H1_FECollection>    fec;
+  std::unique_ptr<FiniteElementSpace> fes;
+  Array<int>                          dirichlet;
+  std::unique_ptr<FiniteElementSpace> vfes;         // vector H1, dof coordinates only
+  std::unique_ptr<GridFunction>       dof_coords;   // built on first request
+};
+
+using PointArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+// 1D view of an MFEM vector, `owner` keeps the memory alive
+py::array_t<double> VectorView(Vector &v, py::handle owner)
+{
+  double *data = v.HostReadWrite();
+  return py::array_t<double>({static_cast<py::ssize_t>(v.Size())},
+                             {static_cast<py::ssize_t>(sizeof(double))}, data, owner);
+}
+
+// (N, dim) row-major points are exactly a (dim x N) column-major DenseMatrix.
+// One O(NE) binning pass per call, then ~O(1) per point (Mesh::FindPoints is O(N x NE))
+void LocatePoints(Mesh &mesh, const PointArray &pts,
+                  Array<int> &elem_ids, Array<IntegrationPoint> &ips)
+{
+  const int dim = mesh.SpaceDimension();
+  if (pts.ndim() != 2 || pts.shape(1) != dim)
+    throw std::invalid_argument("points must have shape (N, " + std::to_string(dim) + ")");
+  DenseMatrix P(const_cast<double*>(pts.data()), dim, static_cast<int>(pts.shape(0)));
+  ElementLocator(mesh).FindPoints(P, elem_ids, ips);
+}
+
+// Values of gf at located points -> (N,) for scalars, (N, vdim) for vectors, NaN outside
+py::array_t<double> EvalAt(const GridFunction &gf, const Array<int> &elem_ids,
+                           const Array<IntegrationPoint> &ips)
+{
+  const py::ssize_t n = elem_ids.Size();
+  const int vdim = gf.VectorDim();
+  py::array_t<double> out = (vdim == 1)
+    ? py::array_t<double>(std::vector<py::ssize_t>{n})
+    : py::array_t<double>(std::vector<py::ssize_t>{n, static_cast<py::ssize_t>(vdim)});
+  double *o = out.mutable_data();
+  Vector val(vdim);
+  for (int i = 0; i < n; ++i)
+  {
+    if (elem_ids[i] < 0)
+    {
+      for (int d = 0; d < vdim; ++d) o[i * vdim + d] = std::numeric_limits<double>::quiet_NaN();
+      continue;
+    }
+    if (vdim == 1) { o[i] = gf.GetValue(elem_ids[i], ips[i]); continue; }
+    gf.GetVectorValue(elem_ids[i], ips[i], val);
+    for (int d = 0; d < vdim; ++d) o[i * vdim + d] = val(d);
+  }
+  return out;
+}
+
+} // namespace
+
+PYBIND11_MODULE(tpc, m)
+{
+  m.doc() = "MFEM electrostatics solver (TPC) bindings";
+
+#ifdef MFEM_USE_MPI
+  // The solver uses MPI_COMM_SELF reductions even in serial
+  int mpi_initialized = 0;
+  MPI_Initialized(&mpi_initialized);
+  if (!mpi_initialized) Mpi::Init();
+#endif
+
+  // -------------------- Config structs --------------------
+  py::class_<Boundary>(m, "Boundary")
+    .def(py::init<>())
+    .def_readwrite("bdr_id", &Boundary::bdr_id)
+    .def_readwrite("type",   &Boundary::type)
+    .def_readwrite("value",  &Boundary::value)
+    .def_readwrite("model",  &Boundary::model)
+    .def_readwrite("alpha",  &Boundary::alpha)
+    .def_readwrite("center", &Boundary::center)
+    .def_readwrite("decay",  &Boundary::decay);
+
+  py::class_<Material>(m, "Material")
+    .def(py::init<>())
+    .def_readwrite("id",        &Material::id)
+    .def_readwrite("epsilon_r", &Material::epsilon_r);
+
+  py::class_<MeshSettings>(m, "MeshSettings")
+    .def_readwrite("path",          &MeshSettings::path)
+    .def_readwrite("element_order", &MeshSettings::element_order);
+
+  py::class_<DebugSettings>(m, "DebugSettings")
+    .def_readwrite("debug",      &DebugSettings::debug)
+    .def_readwrite("quick_mesh", &DebugSettings::quick_mesh);
+
+  py::class_<RevolveSettings>(m, "RevolveSettings")
+    .def_readwrite("path",    &RevolveSettings::path)
+    .def_readwrite("mode",    &RevolveSettings::mode)
+    .def_readwrite("n_theta", &RevolveSettings::n_theta)
+    .def_readwrite("nx",      &RevolveSettings::nx)
+    .def_readwrite("ny",      &RevolveSettings::ny)
+    .def_readwrite("nz",      &RevolveSettings::nz);
+
+  py::class_<WarmStartSettings>(m, "WarmStartSettings")
+    .def_readwrite("mesh",     &WarmStartSettings::mesh)
+    .def_readwrite("solution", &WarmStartSettings::solution);
+
+  py::class_<GoalSettings>(m, "GoalSettings")
+    .def_readwrite("every",   &GoalSettings::every)
+    .def_readwrite("rtol",    &GoalSettings::rtol)
+    .def_readwrite("window",  &GoalSettings::window)
+    .def_readwrite("probes",  &GoalSettings::probes)
+    .def_readwrite("regions", &GoalSettings::regions)
+    .def_readwrite("charges", &GoalSettings::charges)
+    .def_readwrite("energy",  &GoalSettings::energy)
+    .def_readwrite("history", &GoalSettings::history);
+
+  py::class_<SymmetrySettings>(m, "SymmetrySettings")
+    .def_readwrite("x",        &SymmetrySettings::x)
+    .def_readwrite("y",        &SymmetrySettings::y)
+    .def_readwrite("x_bdr_id", &SymmetrySettings::x_bdr_id)
+    .def_readwrite("y_bdr_id", &SymmetrySettings::y_bdr_id)
+    .def_readwrite("path",     &SymmetrySettings::path);
+
+  py::class_<SolverSettings>(m, "SolverSettings")
+    .def_readwrite("axisymmetric",        &SolverSettings::axisymmetric)
+    .def_readwrite("axisymmetric_r0_bd_attribute", &SolverSettings::axisymmetric_r0_bd_attribute)
+    .def_readwrite("order",               &SolverSettings::order)
+    .def_readwrite("assembly_mode",       &SolverSettings::assembly_mode)
+    .def_readwrite("solver",              &SolverSettings::solver)
+    .def_readwrite("precond",             &SolverSettings::precond)
+    .def_readwrite("partial_assembly",    &SolverSettings::partial_assembly)
+    .def_readwrite("atol",                &SolverSettings::atol)
+    .def_readwrite("rtol",                &SolverSettings::rtol)
+    .def_readwrite("maxiter",             &SolverSettings::maxiter)
+    .def_readwrite("printlevel",          &SolverSettings::printlevel)
+    .def_readwrite("mixed_precision",     &SolverSettings::mixed_precision)
+    .def_readwrite("mixed_inner_rtol",    &SolverSettings::mixed_inner_rtol)
+    .def_readwrite("mixed_inner_maxiter", &SolverSettings::mixed_inner_maxiter)
+    .def_readwrite("mixed_max_refine",    &SolverSettings::mixed_max_refine)
+    .def_readwrite("mesh_save_path",      &SolverSettings::mesh_save_path)
+    .def_readwrite("V_solution_path",     &SolverSettings::V_solution_path)
+    .def_readwrite("Emag_solution_path",  &SolverSettings::Emag_solution_path)
+    .def_readwrite("revolve",             &SolverSettings::revolve)
+    .def_readwrite("warm_start",          &SolverSettings::warm_start)
+    .def_readwrite("goal",                &SolverSettings::goal)
+    .def_readwrite("symmetry",            &SolverSettings::symmetry);
+
+  py::class_<Config, std::shared_ptr<Config>>(m, "Config")
+    .def(py::init<>())
+    .def_static("load", [](const std::string &path) {
+      return std::make_shared<Config>(Config::Load(path)); })
+    .def_static("from_string", [](const std::string &yaml) {
+      return std::make_shared<Config>(Config::LoadFromString(yaml)); })
+    .def_readwrite("schema_version", &Config::schema_version)
+    .def_readwrite("geometry_id",    &Config::geometry_id)
+    .def_readwrite("mesh",           &Config::mesh)
+    .def_readwrite("debug",          &Config::debug)
+    .def_readwrite("solver",         &Config::solver)
+    // dict copies; assign the whole dict back to change them
+    .def_readwrite("boundaries",     &Config::boundaries)
+    .def_readwrite("materials",      &Config::materials);
+
+  // -------------------- Mesh / domain --------------------
+  py::class_<Mesh, std::unique_ptr<Mesh>>(m, "Mesh")
+    .def_property_readonly("dimension", &Mesh::Dimension)
+    .def_property_readonly("num_elements", &Mesh::GetNE)
+    .def_property_readonly("num_vertices", &Mesh::GetNV)
+    .def_property_readonly("vertices", [](py::object self) {
+      // Vertex is a plain double[3]: strided (NV, sdim) view
+      Mesh &mesh = self.cast<Mesh&>();
+      const py::ssize_t nv = mesh.GetNV(), sdim = mesh.SpaceDimension();
+      double *base = nv ? const_cast<double*>(mesh.GetVertex(0)) : nullptr;
+      return py::array_t<double>({nv, sdim},
+                                 {static_cast<py::ssize_t>(sizeof(Vertex)),
+                                  static_cast<py::ssize_t>(sizeof(double))}, base, self);
+    })
+    .def("save", [](const Mesh &mesh, const std::string &path) { mesh.Save(path.c_str()); });
+
+  m.def("create_simulation_domain",
+        [](const std::string &path, const std::string &element_order) {
+#ifdef MFEM_USE_MPI
+          return CreateSimulationDomain(path, /*use_distributed=*/false, MPI_COMM_WORLD, element_order);
+#else
+          return CreateSimulationDomain(path, /*use_distributed=*/false, 0, element_order);
+#endif
+        },
+        py::arg("path"), py::arg("element_order") = "none",
+        "Load a gmsh mesh (serial), element_order 'none' | 'hilbert'");
+
+  py::class_<Domain>(m, "Domain")
+    .def(py::init([](Mesh &mesh, std::shared_ptr<Config> cfg) {
+           auto d = std::make_unique<Domain>();
+           d->cfg  = cfg;
+           d->mesh = &mesh;
+           if (cfg->solver.axisymmetric)
+             CheckAxisymmetricMesh(mesh, 0, cfg->solver.axisymmetric_r0_bd_attribute);
+           d->fec = std::make_unique<H1_FECollection>(cfg->solver.order, mesh.Dimension());
+           d->fes = std::make_unique<FiniteElementSpace>(&mesh, d->fec.get());
+           d->dirichlet = GetDirichletAttributes(&mesh, cfg);
+           return d;
+         }),
+         py::arg("mesh"), py::arg("config"), py::keep_alive<1, 2>())
+    .def_property_readonly("num_dofs", [](const Domain &d) { return d.fes->GetTrueVSize(); })
+    .def_property_readonly("dof_coordinates", [](py::object self) {
+      // Physical coordinates of every H1 dof as an (ndofs, dim) view (byVDIM layout)
+      Domain &d = self.cast<Domain&>();
+      const int dim = d.mesh->SpaceDimension();
+      if (!d.dof_coords)
+      {
+        d.vfes = std::make_unique<FiniteElementSpace>(d.mesh, d.fec.get(), dim, Ordering::byVDIM);
+        d.dof_coords = std::make_unique<GridFunction>(d.vfes.get());
+        VectorFunctionCoefficient X(dim, [](const Vector &x, Vector &y) { y = x; });
+        d.dof_coords->ProjectCoefficient(X);
+      }
+      double *data = d.dof_coords->HostReadWrite();
+      const py::ssize_t n = d.dof_coords->Size() / dim;
+      return py::array_t<double>({n, static_cast<py::ssize_t>(dim)},
+                                 {static_cast<py::ssize_t>(dim * sizeof(double)),
+                                  static_cast<py::ssize_t>(sizeof(double))}, data, self);
+    });
+
+  // -------------------- Fields --------------------
+  py::class_<GridFunction, std::unique_ptr<GridFunction>>(m, "GridFunction")
+    .def_property_readonly("vdim", &GridFunction::VectorDim)
+    .def_property_readonly("array", [](py::object self) {
+      return VectorView(self.cast<GridFunction&>(), self); })
+    .def("__len__", [](const GridFunction &gf) { return gf.Size(); })
+    .def("save", [](const GridFunction &gf, const std::string &path) { gf.Save(path.c_str()); });
+
+  // -------------------- Solver --------------------
+  py::class_<PoissonSolver>(m, "PoissonSolver")
+    .def(py::init([](Domain &d) {
+           return std::make_unique<PoissonSolver>(*d.fes, d.dirichlet, d.cfg); }),
+         py::arg("domain"), py::keep_alive<1, 2>())
+    .def("solve", &PoissonSolver::Solve,
+         py::arg("overrides") = std::unordered_map<int, double>{},
+         py::arg("initial_guess") = nullptr,
+         "Solve; overrides maps bdr_id -> value, initial_guess a GridFunction on the same space",
+         py::keep_alive<0, 1>(), py::call_guard<py::gil_scoped_release>())
+    .def_property_readonly("last_iterations", &PoissonSolver::LastIterations)
+    .def_property_readonly("last_solve_time", &PoissonSolver::LastSolveTime)
+    .def_property_readonly("setup_time",      &PoissonSolver::SetupTime);
+
+  m.def("solve_poisson",
+        [](Domain &d) { return SolvePoisson(*d.fes, d.dirichlet, d.cfg); },
+        py::arg("domain"), py::keep_alive<0, 1>(), py::call_guard<py::gil_scoped_release>());
+
+  m.def("transfer_solution",
+        [](Domain &d, const std::string &mesh_path, const std::string &solution_path) {
+          return TransferSolution(*d.fes, mesh_path, solution_path); },
+        py::arg("domain"), py::arg("mesh_path"), py::arg("solution_path"),
+        "Previous solution interpolated onto the domain's dofs (None if unreadable)",
+        py::keep_alive<0, 1>());
+
+  // -------------------- Postprocessing --------------------
+  py::class_<ElectricFieldPostprocessor>(m, "ElectricFieldPostprocessor")
+    .def(py::init([](Domain &d, bool smooth) {
+           return std::make_unique<ElectricFieldPostprocessor>(*d.fes, smooth); }),
+         py::arg("domain"), py::arg("smooth_output") = false, py::keep_alive<1, 2>())
+    .def("make_e",    &ElectricFieldPostprocessor::MakeE,    py::keep_alive<0, 1>())
+    .def("make_emag", &ElectricFieldPostprocessor::MakeEmag, py::keep_alive<0, 1>())
+    .def("compute_electric_field", &ElectricFieldPostprocessor::ComputeElectricField,
+         py::arg("V"), py::arg("E"), py::arg("scale") = -1.0)
+    .def("compute_field_magnitude", &ElectricFieldPostprocessor::ComputeFieldMagnitude)
+    .def("save_components",         &ElectricFieldPostprocessor::SaveComponents)
+    .def_property_readonly("dimension", &ElectricFieldPostprocessor::Dimension)
+    .def_property_readonly("smooth",    &ElectricFieldPostprocessor::Smooth);
+
+  // -------------------- Batched point evaluation --------------------
+  m.def("evaluate", [](const GridFunction &gf, const PointArray &points) {
+          Array<int> ids; Array<IntegrationPoint> ips;
+          LocatePoints(*gf.FESpace()->GetMesh(), points, ids, ips);
+          return EvalAt(gf, ids, ips);
+        },
+        py::arg("gf"), py::arg("points"),
+        "Values at (N, dim) points: (N,) or (N, vdim), NaN outside the mesh");
+
+  m.def("probe", [](const GridFunction &V, const GridFunction &E, const PointArray &points) {
+          Array<int> ids; Array<IntegrationPoint> ips;
+          LocatePoints(*V.FESpace()->GetMesh(), points, ids, ips);   // one search for both
+          return py::make_tuple(EvalAt(V, ids, ips), EvalAt(E, ids, ips));
+        },
+        py::arg("V"), py::arg("E"), py::arg("points"),
+        "(V (N,), E (N, dim)) at (N, dim) points");
+}
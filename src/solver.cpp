@@ -1,4 +1,7 @@
 #include "solver.h"
+#include "mixed_precision.h"
+#include "goal_control.h"
+#include "config/Config.h"
 
 // Internal Helper for axisymmetric
 inline std::unique_ptr<mfem::Coefficient>
@@ -17,6 +20,51 @@ MakeAxisymWeightCoeff(bool axisymmetric, int radial_idx)
   return std::make_unique<mfem::FunctionCoefficient>(w_of_X);
 }
 
+// Axisymmetric fast path: 2*pi*r*eps(attr) evaluated once per quadrature point.
+// Avoids the FunctionCoefficient/ProductCoefficient dispatch during assembly and is
+// usable with partial assembly. Needs a single element geometry because the
+// quadrature space and the integrator must share one IntegrationRule.
+struct AxisymWeights
+{
+  const mfem::IntegrationRule *ir = nullptr;
+  std::unique_ptr<mfem::QuadratureSpace>               qs;
+  std::unique_ptr<mfem::QuadratureFunction>            qf;
+  std::unique_ptr<mfem::QuadratureFunctionCoefficient> coeff;
+};
+
+static bool BuildAxisymWeights(mfem::FiniteElementSpace &fes,
+                               mfem::PWConstCoefficient &eps,
+                               int radial_idx,
+                               AxisymWeights &out)
+{
+  using namespace mfem;
+  Mesh &mesh = *fes.GetMesh();
+  if (mesh.GetNE() == 0 || mesh.GetNumGeometries(mesh.Dimension()) != 1) return false;
+
+  const FiniteElement &fe = *fes.GetFE(0);
+  out.ir = &DiffusionIntegrator::GetRule(fe, fe);
+  out.qs = std::make_unique<QuadratureSpace>(mesh, *out.ir);
+  out.qf = std::make_unique<QuadratureFunction>(out.qs.get());
+
+  Vector X, vals;
+  for (int e = 0; e < mesh.GetNE(); ++e)
+  {
+    ElementTransformation *T = mesh.GetElementTransformation(e);
+    const double eps_e = eps(mesh.GetAttribute(e));
+    out.qf->GetValues(e, vals);   // view into qf
+    for (int i = 0; i < out.ir->GetNPoints(); ++i)
+    {
+      const IntegrationPoint &ip = out.ir->IntPoint(i);
+      T->SetIntPoint(&ip);
+      T->Transform(ip, X);
+      const double r = std::max(X(radial_idx), 0.0);   // guard tiny negatives from roundoff
+      vals(i) = 2.0 * M_PI * r * eps_e;
+    }
+  }
+  out.coeff = std::make_unique<QuadratureFunctionCoefficient>(*out.qf);
+  return true;
+}
+
 // Internal Helper for distributed
 inline bool IsDistributed(const mfem::FiniteElementSpace &fes)
 {
@@ -67,82 +115,162 @@ static PWConstCoefficient BuildEpsilonPWConst(const Mesh &mesh, const std::share
     return PWConstCoefficient(eps_by_attr);
 }
 
-std::unique_ptr<mfem::GridFunction> SolvePoisson(mfem::FiniteElementSpace &fespace,
-                                                const mfem::Array<int> &dirichlet_attr,
-                                                const std::shared_ptr<const Config>& cfg)
+PoissonSolver::PoissonSolver(FiniteElementSpace &fespace,
+                             const Array<int> &dirichlet_attr,
+                             const std::shared_ptr<const Config>& cfg)
+  : fespace_(fespace), dirichlet_attr_(dirichlet_attr), cfg_(cfg)
 {
-  using namespace mfem;
+  StopWatch setup_timer;
+  setup_timer.Start();
 
-  const Mesh &mesh = *fespace.GetMesh();
-  PWConstCoefficient epsilon_pw = BuildEpsilonPWConst(mesh, cfg);
+  const Mesh &mesh = *fespace_.GetMesh();
+  epsilon_pw_ = std::make_unique<PWConstCoefficient>(BuildEpsilonPWConst(mesh, cfg_));
 
-  // common handles (filled inside the single if/else)
-  std::unique_ptr<GridFunction> V;        // GridFunction or ParGridFunction
-  std::unique_ptr<BilinearForm> a;        // BilinearForm or ParBilinearForm
-  std::unique_ptr<LinearForm>   b;        // LinearForm   or ParLinearForm
-  OperatorHandle                A;        // SparseMatrix or HypreParMatrix
-  Vector                        X, B;     // works for both
-  std::function<std::unique_ptr<Solver>(OperatorHandle&)> make_prec;
-  MPI_Comm                      comm = MPI_COMM_SELF;
+  par_     = IsDistributed(fespace_);
+  partial_ = cfg_->solver.partial_assembly;
+  mixed_   = cfg_->solver.mixed_precision && !partial_;
+  comm_    = GetComm(fespace_);
 
-  const bool par = (dynamic_cast<ParFiniteElementSpace*>(&fespace) != nullptr);
+  // hypre has no float storage: refinement around double BoomerAMG only costs extra work
+  MFEM_VERIFY(!(cfg_->solver.mixed_precision && par_),
+              "solver.mixed_precision is serial only (hypre matrices are double), "
+              "disable it or compute.mpi.");
 
-  if (par) {
+  if (par_) {
     // ---------- parallel concrete types ----------
-    auto &pfes = static_cast<ParFiniteElementSpace&>(fespace);
-    V = std::make_unique<ParGridFunction>(&pfes);
-    a = std::make_unique<ParBilinearForm>(&pfes);
-    b = std::make_unique<ParLinearForm>(&pfes);
-    comm = pfes.GetParMesh()->GetComm();
-
-    // build the proper preconditioner later, after A exists
-    make_prec = [=](OperatorHandle &Ah) -> std::unique_ptr<Solver>
-    {
-      auto *Ap = Ah.As<HypreParMatrix>();
-      return std::make_unique<HypreBoomerAMG>(*Ap);
-    };
+    auto &pfes = static_cast<ParFiniteElementSpace&>(fespace_);
+    a_ = std::make_unique<ParBilinearForm>(&pfes);
+    b_ = std::make_unique<ParLinearForm>(&pfes);
   } else {
     // ---------- serial concrete types ----------
-    V = std::make_unique<GridFunction>(&fespace);
-    a = std::make_unique<BilinearForm>(&fespace);
-    b = std::make_unique<LinearForm>(&fespace);
-    comm = MPI_COMM_SELF;
+    a_ = std::make_unique<BilinearForm>(&fespace_);
+    b_ = std::make_unique<LinearForm>(&fespace_);
+  }
+
+  if (partial_) a_->SetAssemblyLevel(AssemblyLevel::PARTIAL);
+
+  w_    = MakeAxisymWeightCoeff(cfg_->solver.axisymmetric, 0);
+  weps_ = std::make_unique<ProductCoefficient>(*w_, *epsilon_pw_);
+  axw_  = std::make_unique<AxisymWeights>();
 
-    make_prec = [=](OperatorHandle &Ah) -> std::unique_ptr<Solver>
+  if (cfg_->solver.axisymmetric && BuildAxisymWeights(fespace_, *epsilon_pw_, 0, *axw_))
+  {
+    auto *integ = new DiffusionIntegrator(*axw_->coeff);
+    integ->SetIntRule(axw_->ir);
+    a_->AddDomainIntegrator(integ);
+  }
+  else
+  {
+    if (cfg_->solver.axisymmetric)
+      std::cout << "[Axisym] mixed element geometries, using the generic weight coefficient\n";
+    a_->AddDomainIntegrator(new DiffusionIntegrator(*weps_));
+  }
+
+  // Open (asymptotic Robin) / generic Robin boundaries
+  if (const int n_robin = AddRobinBoundaries(*a_, *b_, *epsilon_pw_, cfg_, robin_))
+    std::cout << "[BC] " << n_robin << " Robin boundar" << (n_robin == 1 ? "y" : "ies") << "\n";
+  a_->Assemble();                 // Finalize() not needed with OperatorHandle path
+  b_->Assemble();
+  b0_ = *b_;
+
+  fespace_.GetEssentialTrueDofs(dirichlet_attr_, ess_tdof_);
+
+  // First elimination fixes A; later FormLinearSystem calls only touch the RHS
+  std::unique_ptr<GridFunction> V0(par_ ? new ParGridFunction(&static_cast<ParFiniteElementSpace&>(fespace_))
+                                        : new GridFunction(&fespace_));
+  *V0 = 0.0;
+  Vector X, B, b(b0_);
+  a_->FormLinearSystem(ess_tdof_, *V0, b, A_, X, B);
+
+  if (cfg_->solver.mixed_precision && partial_)
+    std::cout << "[Solve] mixed precision needs an assembled matrix, ignored with partial assembly\n";
+
+  if (mixed_)
+  {
+    solver_ = std::make_unique<MixedPrecisionSolver>(A_, cfg_->solver);
+  }
+  else
+  {
+    // No matrix with partial assembly -> diagonal (Jacobi) preconditioner from the PA diagonal
+    if (partial_)  P_ = std::make_unique<OperatorJacobiSmoother>(*a_, ess_tdof_);
+    else if (par_) P_ = std::make_unique<HypreBoomerAMG>(*A_.As<HypreParMatrix>());
+    else           P_ = std::make_unique<DSmoother>(*A_.As<SparseMatrix>());
+
+    auto cg = std::make_unique<CGSolver>(comm_);
+    cg->SetOperator(*A_.Ptr());       // OperatorHandle -> Operator&
+    cg->SetPreconditioner(*P_);
+    cg->SetRelTol(cfg_->solver.rtol);
+    cg->SetAbsTol(cfg_->solver.atol);
+    cg->SetMaxIter(cfg_->solver.maxiter);
+    cg->SetPrintLevel(cfg_->solver.printlevel);
+    if (cfg_->solver.goal.every > 0)
     {
-      auto *As = Ah.As<SparseMatrix>();
-      return std::make_unique<DSmoother>(*As);
-    };
+      goal_ = std::make_unique<GoalOrientedController>(fespace_, *epsilon_pw_, cfg_->solver);
+      cg->SetMonitor(*goal_);
+    }
+    solver_ = std::move(cg);
   }
+  if (mixed_ && cfg_->solver.goal.every > 0)
+    std::cout << "[Goal] goal-oriented stopping needs plain CG, ignored with mixed precision\n";
 
-  // ---------- shared body ----------
-  *V = 0.0;
-  ApplyDirichletValues(*V, dirichlet_attr, cfg);
+  setup_timer.Stop();
+  setup_time_ = setup_timer.RealTime();
+}
 
-  auto w = MakeAxisymWeightCoeff(cfg->solver.axisymmetric, 0);
-  mfem::ProductCoefficient weps(*w, epsilon_pw);
-  a->AddDomainIntegrator(new DiffusionIntegrator(weps));
-  a->Assemble();                 // Finalize() not needed with OperatorHandle path
+PoissonSolver::~PoissonSolver() = default;
 
-  b->Assemble();
+std::unique_ptr<GridFunction> PoissonSolver::Solve(const std::unordered_map<int, double> &overrides,
+                                                   const GridFunction *initial_guess)
+{
+  std::unique_ptr<GridFunction> V;        // GridFunction or ParGridFunction
+  if (par_) V = std::make_unique<ParGridFunction>(&static_cast<ParFiniteElementSpace&>(fespace_));
+  else      V = std::make_unique<GridFunction>(&fespace_);
+
+  if (initial_guess)
+  {
+    MFEM_VERIFY(initial_guess->Size() == V->Size(), "Initial guess lives on a different space.");
+    *V = *initial_guess;
+  }
+  else *V = 0.0;
+  ApplyDirichletValues(*V, dirichlet_attr_, cfg_, overrides);   // (re)impose the boundary values
+
+  // CG ignores X unless in iterative mode (mixed precision always starts from X)
+  if (auto *it = dynamic_cast<IterativeSolver*>(solver_.get())) it->iterative_mode = (initial_guess != nullptr);
+
+  // Operator is already eliminated, this only builds X and B (A is unchanged)
+  // In serial B aliases b and the elimination subtracts A_e*x in place: start from a fresh copy
+  OperatorHandle A;
+  Vector X, B, b(b0_);
+  // copy_interior keeps the guess in X (otherwise only the boundary values survive)
+  a_->FormLinearSystem(ess_tdof_, *V, b, A, X, B, /*copy_interior=*/initial_guess != nullptr);
 
-  Array<int> ess_tdof;
-  fespace.GetEssentialTrueDofs(dirichlet_attr, ess_tdof);
+  StopWatch solve_timer;
+  solve_timer.Start();
 
-  a->FormLinearSystem(ess_tdof, *V, *b, A, X, B);   // fills A, X, B for both modes
+  if (goal_) goal_->SetSystem(*A_.Ptr(), B);
+  solver_->Mult(B, X);
+  if (auto *cg = dynamic_cast<IterativeSolver*>(solver_.get())) last_its_ = cg->GetNumIterations();
+  else last_its_ = static_cast<MixedPrecisionSolver*>(solver_.get())->GetNumIterations();
 
-  auto P = make_prec(A);          // DSmoother or HypreBoomerAMG, already decided
+  solve_timer.Stop();
+  last_time_ = solve_timer.RealTime();
+  std::cout << "[Solve] " << (mixed_ ? "mixed" : "double")
+            << " precision" << (initial_guess ? ", warm start" : "") << ": " << last_its_ << " CG iterations in "
+            << last_time_ << " s (" << (last_time_ > 0.0 ? last_its_ / last_time_ : 0.0)
+            << " it/s, setup " << setup_time_ << " s)\n";
 
-  CGSolver cg(comm);
-  cg.SetOperator(*A.Ptr());       // OperatorHandle -> Operator&
-  cg.SetPreconditioner(*P);
-  cg.SetRelTol(cfg->solver.rtol);
-  cg.SetAbsTol(cfg->solver.atol);
-  cg.SetMaxIter(cfg->solver.maxiter);
-  cg.SetPrintLevel(cfg->solver.printlevel);
-  cg.Mult(B, X);
+  if (goal_) goal_->Finish(last_its_);
 
-  a->RecoverFEMSolution(X, *b, *V);
+  a_->RecoverFEMSolution(X, b, *V);
 
   return V;
 }
+
+std::unique_ptr<mfem::GridFunction> SolvePoisson(mfem::FiniteElementSpace &fespace,
+                                                const mfem::Array<int> &dirichlet_attr,
+                                                const std::shared_ptr<const Config>& cfg,
+                                                const mfem::GridFunction *initial_guess)
+{
+  PoissonSolver solver(fespace, dirichlet_attr, cfg);
+  return solver.Solve({}, initial_guess);
+}
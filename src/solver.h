@@ -2,7 +2,61 @@
 
 #include "mfem.hpp"
 #include "boundary_conditions.h"
+#include <unordered_map>
 using namespace mfem;
 
 struct Config; // forward declaration - still used?
-std::unique_ptr<mfem::GridFunction> SolvePoisson(mfem::FiniteElementSpace &fespace, const mfem::Array<int> &dirichlet_attr, const std::shared_ptr<const Config>& cfg);
+struct AxisymWeights; // solver.cpp
+class GoalOrientedController;
+
+// Assembles the operator and preconditioner once, then solves for any set of
+// Dirichlet values on the same boundaries (used by the one-shot solve and the service)
+class PoissonSolver
+{
+public:
+  PoissonSolver(mfem::FiniteElementSpace &fespace,
+                const mfem::Array<int> &dirichlet_attr,
+                const std::shared_ptr<const Config>& cfg);
+  ~PoissonSolver();
+
+  // Dirichlet values from the config, entries in `overrides` (bdr_id -> value) win.
+  // `initial_guess` (same space) seeds CG, its boundary values are replaced by the Dirichlet data.
+  std::unique_ptr<mfem::GridFunction> Solve(const std::unordered_map<int, double> &overrides = {},
+                                            const mfem::GridFunction *initial_guess = nullptr);
+
+  int    LastIterations() const { return last_its_; }
+  double LastSolveTime()  const { return last_time_; }
+  double SetupTime()      const { return setup_time_; }
+
+private:
+  mfem::FiniteElementSpace      &fespace_;
+  mfem::Array<int>               dirichlet_attr_;
+  std::shared_ptr<const Config>  cfg_;
+  bool                           par_ = false;
+  bool                           partial_ = false;
+  bool                           mixed_ = false;
+  MPI_Comm                       comm_ = MPI_COMM_SELF;
+
+  // Coefficients must outlive the forms
+  std::unique_ptr<mfem::PWConstCoefficient> epsilon_pw_;
+  std::unique_ptr<mfem::Coefficient>        w_;
+  std::unique_ptr<mfem::ProductCoefficient> weps_;
+  std::unique_ptr<AxisymWeights>            axw_;
+  RobinTerms                                robin_;
+
+  std::unique_ptr<mfem::BilinearForm> a_;   // BilinearForm or ParBilinearForm
+  std::unique_ptr<mfem::LinearForm>   b_;   // LinearForm   or ParLinearForm
+  mfem::Vector                        b0_;  // assembled RHS, copied per solve (elimination edits it in place)
+  mfem::Array<int>                    ess_tdof_;
+  mfem::OperatorHandle                A_;   // SparseMatrix, HypreParMatrix or PA operator
+  std::unique_ptr<mfem::Solver>       P_;
+  std::unique_ptr<mfem::Solver>       solver_;  // CGSolver or MixedPrecisionSolver
+  std::unique_ptr<GoalOrientedController> goal_;  // optional QoI-based stopping (CG only)
+
+  int    last_its_   = 0;
+  double last_time_  = 0.0;
+  double setup_time_ = 0.0;
+};
+
+std::unique_ptr<mfem::GridFunction> SolvePoisson(mfem::FiniteElementSpace &fespace, const mfem::Array<int> &dirichlet_attr, const std::shared_ptr<const Config>& cfg,
+                                                 const mfem::GridFunction *initial_guess = nullptr);
@@ -0,0 +1,283 @@
+#include "solver_service.h"
+
+#include <sys/socket.h>
+#include <sys/un.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <cerrno>
+#include <cstring>
+#include <fstream>
+#include <iostream>
+#include <limits>
+#include <sstream>
+
+using namespace mfem;
+
+// -------------------- Connection (line based socket I/O) --------------------
+
+class SolverService::Connection
+{
+public:
+  explicit Connection(int fd) : fd_(fd) {}
+  ~Connection() { ::close(fd_); }
+
+  // false on EOF / error
+  bool ReadLine(std::string &line)
+  {
+    for (;;)
+    {
+      const auto pos = buf_.find('\n');
+      if (pos != std::string::npos)
+      {
+        line = buf_.substr(0, pos);
+        if (!line.empty() && line.back() == '\r') line.pop_back();
+        buf_.erase(0, pos + 1);
+        return true;
+      }
+      char chunk[4096];
+      const ssize_t n = ::recv(fd_, chunk, sizeof(chunk), 0);
+      if (n < 0 && errno == EINTR) continue;
+      if (n <= 0) return false;
+      buf_.append(chunk, static_cast<size_t>(n));
+    }
+  }
+
+  void Write(const std::string &s)
+  {
+    size_t off = 0;
+    while (off < s.size())
+    {
+      const ssize_t n = ::send(fd_, s.data() + off, s.size() - off, MSG_NOSIGNAL);
+      if (n < 0 && errno == EINTR) continue;
+      if (n <= 0) return;   // client went away, the read loop notices
+      off += static_cast<size_t>(n);
+    }
+  }
+
+private:
+  int         fd_;
+  std::string buf_;
+};
+
+// -------------------- SolverService ------------------------------------------
+
+SolverService::SolverService(FiniteElementSpace &fespace,
+                             const Array<int> &dirichlet_attr,
+                             const std::shared_ptr<const Config>& cfg)
+  : fespace_(fespace),
+    dirichlet_attr_(dirichlet_attr),
+    cfg_(cfg),
+    solver_(fespace, dirichlet_attr, cfg),
+    post_(fespace, /*smooth_output=*/false),
+    locator_(*fespace.GetMesh())
+{
+  std::cout << "[Service] setup (assembly + preconditioner) took "
+            << solver_.SetupTime() << " s\n";
+  Solve({});   // start from the config voltages so PROBE/EXPORT always have data
+
+  if (cfg_->debug.debug)
+  {
+    // Every SOLVE reuses the assembled system, a second identical solve must not drift
+    auto V2 = solver_.Solve({});
+    *V2 -= *V_;
+    const double diff = V2->Normlinf(), ref = std::max(1.0, V_->Normlinf());
+    std::cout << "[Service] repeated solve max |dV| = " << diff << "\n";
+    MFEM_VERIFY(diff <= 1e-6 * ref, "Repeated solve with the same voltages changed V by " << diff);
+  }
+}
+
+void SolverService::Solve(const std::unordered_map<int, double> &overrides)
+{
+  V_ = solver_.Solve(overrides);
+  if (!E_) E_ = post_.MakeE();
+  post_.ComputeElectricField(*V_, *E_, /*scale=*/-1.0);
+}
+
+bool SolverService::Handle(const std::string &line, Connection &conn)
+{
+  std::istringstream in(line);
+  std::string cmd;
+  in >> cmd;
+
+  if (cmd.empty()) return true;
+  if (cmd == "PING") { conn.Write("OK\n"); return true; }
+  if (cmd == "QUIT") { conn.Write("OK\n"); return false; }
+  if (cmd == "SHUTDOWN") { conn.Write("OK\n"); shutdown_ = true; return false; }
+
+  if (cmd == "SOLVE")
+  {
+    std::unordered_map<int, double> overrides;
+    std::string tok;
+    while (in >> tok)
+    {
+      const auto eq = tok.find('=');
+      try
+      {
+        if (eq == std::string::npos) throw std::invalid_argument(tok);
+        overrides[std::stoi(tok.substr(0, eq))] = std::stod(tok.substr(eq + 1));
+      }
+      catch (const std::exception &)
+      {
+        conn.Write("ERR expected bdr_id=value, got '" + tok + "'\n");
+        return true;
+      }
+    }
+    for (const auto &[id, value] : overrides)
+    {
+      if (id < 1 || id > dirichlet_attr_.Size() || !dirichlet_attr_[id - 1])
+      {
+        conn.Write("ERR unknown dirichlet bdr_id " + std::to_string(id) + "\n");
+        return true;
+      }
+    }
+    Solve(overrides);
+    std::ostringstream out;
+    out << "OK its=" << solver_.LastIterations() << " time=" << solver_.LastSolveTime() << "\n";
+    conn.Write(out.str());
+    return true;
+  }
+
+  if (cmd == "PROBE")
+  {
+    int n = -1;
+    if (!(in >> n) || n < 0) { conn.Write("ERR PROBE <n> followed by n coordinate lines\n"); return true; }
+    if (n > MaxProbePoints)
+    {
+      // The n coordinate lines cannot be skipped safely, drop the connection instead
+      conn.Write("ERR PROBE at most " + std::to_string(MaxProbePoints) + " points per request\n");
+      return false;
+    }
+
+    Mesh &mesh = *fespace_.GetMesh();
+    const int dim = mesh.Dimension();
+    DenseMatrix pts(dim, n);
+    std::string bad;
+    for (int i = 0; i < n; ++i)   // always consume all n lines to stay in sync
+    {
+      std::string pline;
+      if (!conn.ReadLine(pline)) return false;
+      std::istringstream ps(pline);
+      for (int d = 0; d < dim; ++d)
+      {
+        if (!(ps >> pts(d, i)) && bad.empty()) bad = pline;
+      }
+    }
+    if (!bad.empty()) { conn.Write("ERR bad coordinate line '" + bad + "'\n"); return true; }
+
+    // Symmetry-reduced mesh: look up the mirror image inside the sector
+    const auto &sym = cfg_->solver.symmetry;
+    DenseMatrix sign(dim, n);
+    sign = 1.0;
+    if (sym.x || sym.y)
+    {
+      Vector x, sg;
+      for (int i = 0; i < n; ++i)
+      {
+        pts.GetColumnReference(i, x);
+        FoldIntoSymmetrySector(x, sg, sym.x, sym.y);
+        sign.SetCol(i, sg);
+      }
+    }
+
+    // Binned point location (Mesh::FindPoints would scan all elements per point)
+    Array<int> elem_ids;
+    Array<IntegrationPoint> ips;
+    locator_.FindPoints(pts, elem_ids, ips);
+
+    std::ostringstream out;
+    out.precision(12);
+    out << "OK " << n << "\n";
+    Vector Ev(dim);
+    for (int i = 0; i < n; ++i)
+    {
+      if (elem_ids[i] < 0)
+      {
+        out << "nan";
+        for (int d = 0; d < dim; ++d) out << " nan";
+        out << "\n";
+        continue;
+      }
+      E_->GetVectorValue(elem_ids[i], ips[i], Ev);
+      out << V_->GetValue(elem_ids[i], ips[i]);
+      for (int d = 0; d < dim; ++d) out << " " << sign(d, i) * Ev(d);
+      out << "\n";
+    }
+    conn.Write(out.str());
+    return true;
+  }
+
+  if (cmd == "EXPORT")
+  {
+    std::string prefix;
+    if (!(in >> prefix)) { conn.Write("ERR EXPORT <prefix>\n"); return true; }
+    V_->Save((prefix + "_V.gf").c_str());
+    post_.SaveComponents(*E_, prefix);
+    auto Emag = post_.MakeEmag();
+    post_.ComputeFieldMagnitude(*E_, *Emag);
+    { std::ofstream ofs(prefix + "_mag.gf"); Emag->Save(ofs); }
+    conn.Write("OK\n");
+    return true;
+  }
+
+  conn.Write("ERR unknown command '" + cmd + "'\n");
+  return true;
+}
+
+int SolverService::Run(const std::string &socket_path)
+{
+  sockaddr_un addr{};
+  if (socket_path.size() >= sizeof(addr.sun_path))
+  {
+    std::cerr << "[Service] socket path too long: " << socket_path << "\n";
+    return 1;
+  }
+
+  const int srv = ::socket(AF_UNIX, SOCK_STREAM, 0);
+  if (srv < 0) { std::cerr << "[Service] socket(): " << std::strerror(errno) << "\n"; return 1; }
+
+  addr.sun_family = AF_UNIX;
+  std::strncpy(addr.sun_path, socket_path.c_str(), sizeof(addr.sun_path) - 1);
+  ::unlink(socket_path.c_str());   // stale socket from a previous run
+  if (::bind(srv, reinterpret_cast<sockaddr*>(&addr), sizeof(addr)) < 0 || ::listen(srv, 4) < 0)
+  {
+    std::cerr << "[Service] bind/listen on " << socket_path << ": " << std::strerror(errno) << "\n";
+    ::close(srv);
+    return 1;
+  }
+  std::cout << "[Service] listening on " << socket_path << std::endl;
+
+  while (!shutdown_)
+  {
+    const int fd = ::accept(srv, nullptr, nullptr);
+    if (fd < 0)
+    {
+      if (errno == EINTR) continue;
+      std::cerr << "[Service] accept(): " << std::strerror(errno) << "\n";
+      break;
+    }
+
+    // One client at a time, the operator is shared state
+    Connection conn(fd);
+    std::string line;
+    while (conn.ReadLine(line))
+    {
+      if (cfg_->debug.debug) std::cout << "[Service] <- " << line << "\n";
+      // A failing request must not take the resident service down
+      try
+      {
+        if (!Handle(line, conn)) break;
+      }
+      catch (const std::exception &e)
+      {
+        std::cerr << "[Service] request '" << line << "' failed: " << e.what() << "\n";
+        conn.Write(std::string("ERR ") + e.what() + "\n");
+      }
+    }
+  }
+
+  ::close(srv);
+  ::unlink(socket_path.c_str());
+  std::cout << "[Service] stopped\n";
+  return 0;
+}
@@ -0,0 +1,58 @@
+#pragma once
+#ifndef SOLVER_SERVICE_H
+#define SOLVER_SERVICE_H
+
+#include "mfem.hpp"
+#include "solver.h"
+#include "ComputeElectricField.h"
+#include "element_locator.h"
+#include "config/Config.h"
+#include <memory>
+#include <string>
+
+/*
+Long running solver: mesh, FE space, operator and preconditioner stay resident,
+requests come in over a local (UNIX domain) socket, one line per command:
+
+  PING                           -> OK
+  SOLVE [bdr_id=value ...]       -> OK its=<n> time=<s>      (unlisted boundaries use the config,
+                                                              bdr_id must be a Dirichlet boundary)
+  PROBE <n>  + n lines "x y [z]" -> OK <n> + n lines "V Ex Ey [Ez]" (nan outside the mesh,
+                                                              n <= 1e6, larger n closes the connection)
+  EXPORT <prefix>                -> OK                        (<prefix>_V.gf, <prefix>_ex.gf, ...)
+  QUIT                           -> closes this connection
+  SHUTDOWN                       -> stops the service
+Errors are answered with "ERR <message>".
+*/
+class SolverService
+{
+public:
+  SolverService(mfem::FiniteElementSpace &fespace,
+                const mfem::Array<int> &dirichlet_attr,
+                const std::shared_ptr<const Config>& cfg);
+
+  // Blocks until SHUTDOWN; returns the process exit code
+  int Run(const std::string &socket_path);
+
+private:
+  class Connection;
+
+  static constexpr int MaxProbePoints = 1000000;   // per PROBE request
+
+  // Returns false when the connection should be closed
+  bool Handle(const std::string &line, Connection &conn);
+
+  void Solve(const std::unordered_map<int, double> &overrides);
+
+  mfem::FiniteElementSpace           &fespace_;
+  mfem::Array<int>                    dirichlet_attr_;
+  std::shared_ptr<const Config>       cfg_;
+  PoissonSolver                       solver_;
+  ElectricFieldPostprocessor          post_;
+  ElementLocator                      locator_;   // binned point lookup, built once
+  std::unique_ptr<mfem::GridFunction> V_;
+  std::unique_ptr<mfem::GridFunction> E_;
+  bool                                shutdown_ = false;
+};
+
+#endif // SOLVER_SERVICE_H
@@ -0,0 +1,81 @@
+"""
+Minimal client for the solver service (TPC --serve <socket>)
+
+  python tpc_client.py /tmp/tpc.sock ping
+  python tpc_client.py /tmp/tpc.sock solve 1000=500 1001=0
+  python tpc_client.py /tmp/tpc.sock probe "0.1 0.2" "0.3 0.4"
+  python tpc_client.py /tmp/tpc.sock export run1
+  python tpc_client.py /tmp/tpc.sock shutdown
+"""
+import socket
+import sys
+
+
+class SolverClient:
+    def __init__(self, path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self.reader = self.sock.makefile("r")
+
+    def _request(self, lines):
+        self.sock.sendall(("\n".join(lines) + "\n").encode())
+        reply = self.reader.readline().strip()
+        if not reply.startswith("OK"):
+            raise RuntimeError(reply)
+        return reply
+
+    def ping(self):
+        return self._request(["PING"])
+
+    def solve(self, voltages=None):
+        """voltages: {bdr_id: value}, unlisted boundaries keep the config value"""
+        args = " ".join(f"{k}={v}" for k, v in (voltages or {}).items())
+        reply = self._request([f"SOLVE {args}".strip()])
+        return dict(kv.split("=") for kv in reply.split()[1:])
+
+    def probe(self, points):
+        """points: list of (x, y[, z]) -> list of (V, Ex, Ey[, Ez])"""
+        reply = self._request([f"PROBE {len(points)}"] + [" ".join(map(str, p)) for p in points])
+        n = int(reply.split()[1])
+        return [tuple(float(v) for v in self.reader.readline().split()) for _ in range(n)]
+
+    def export(self, prefix):
+        return self._request([f"EXPORT {prefix}"])
+
+    def shutdown(self):
+        return self._request(["SHUTDOWN"])
+
+    def close(self):
+        try:
+            self._request(["QUIT"])
+        except (OSError, RuntimeError):
+            pass
+        self.sock.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+
+    client = SolverClient(sys.argv[1])
+    cmd, args = sys.argv[2].lower(), sys.argv[3:]
+    if cmd == "ping":
+        print(client.ping())
+    elif cmd == "solve":
+        print(client.solve({int(k): float(v) for k, v in (a.split("=") for a in args)}))
+    elif cmd == "probe":
+        for p, res in zip(args, client.probe([tuple(map(float, a.split())) for a in args])):
+            print(p, "->", *res)
+    elif cmd == "export":
+        if len(args) != 1:
+            print(__doc__)
+            sys.exit(1)
+        print(client.export(args[0]))
+    elif cmd == "shutdown":
+        print(client.shutdown())
+        sys.exit(0)
+    else:
+        print(__doc__)
+        sys.exit(1)
+    client.close()
@@ -0,0 +1,71 @@
+#include "warm_start.h"
+#include "element_locator.h"
+
+#include <fstream>
+#include <iostream>
+#include <vector>
+
+using namespace mfem;
+
+std::unique_ptr<GridFunction>
+TransferSolution(FiniteElementSpace &fes,
+                 const std::string &old_mesh_path,
+                 const std::string &old_solution_path)
+{
+  std::ifstream mesh_in(old_mesh_path), gf_in(old_solution_path);
+  if (!mesh_in || !gf_in)
+  {
+    std::cerr << "\033[33m" << "WARNING: warm start files '" << old_mesh_path << "' / '"
+              << old_solution_path << "' not readable, starting from zero" << "\033[0m\n";
+    return nullptr;
+  }
+
+  StopWatch timer;
+  timer.Start();
+
+  Mesh old_mesh(mesh_in);
+  GridFunction old_V(&old_mesh, gf_in);
+  MFEM_VERIFY(old_mesh.SpaceDimension() == fes.GetMesh()->SpaceDimension(),
+              "Warm start mesh has a different space dimension.");
+
+  ElementLocator locator(old_mesh);
+
+  std::unique_ptr<GridFunction> V;
+#ifdef MFEM_USE_MPI
+  if (auto *pfes = dynamic_cast<ParFiniteElementSpace*>(&fes)) V = std::make_unique<ParGridFunction>(pfes);
+  else
+#endif
+  V = std::make_unique<GridFunction>(&fes);
+  *V = 0.0;
+
+  // Nodal (H1) dofs: evaluate the old solution at every local dof's node once
+  Mesh &mesh = *fes.GetMesh();
+  std::vector<char> done(V->Size(), 0);
+  Array<int> dofs;
+  Vector x;
+  IntegrationPoint ip;
+  int found = 0, missed = 0;
+  for (int e = 0; e < mesh.GetNE(); ++e)
+  {
+    fes.GetElementDofs(e, dofs);
+    const IntegrationRule &nodes = fes.GetFE(e)->GetNodes();
+    ElementTransformation *T = mesh.GetElementTransformation(e);
+    for (int i = 0; i < dofs.Size(); ++i)
+    {
+      const int dof = dofs[i] >= 0 ? dofs[i] : -1 - dofs[i];
+      if (done[dof]) continue;
+      done[dof] = 1;
+
+      T->Transform(nodes.IntPoint(i), x);
+      const int old_e = locator.Locate(x, ip);
+      if (old_e < 0) { ++missed; continue; }
+      (*V)(dof) = old_V.GetValue(old_e, ip);
+      ++found;
+    }
+  }
+
+  timer.Stop();
+  std::cout << "[WarmStart] " << found << " dofs interpolated from " << old_solution_path
+            << " (" << missed << " outside the old mesh -> 0) in " << timer.RealTime() << " s\n";
+  return V;
+}
@@ -0,0 +1,18 @@
+#pragma once
+#ifndef WARM_START_H
+#define WARM_START_H
+
+#include "mfem.hpp"
+#include <memory>
+#include <string>
+
+// Interpolates a previous solution (mesh file + GridFunction file, e.g. the
+// simulation_mesh.msh / solution_V.gf of an earlier design) onto the dofs of `fes`.
+// Dofs outside the old mesh get 0. Each rank transfers its local dofs against its
+// own copy of the old mesh. Returns nullptr if the files cannot be read.
+std::unique_ptr<mfem::GridFunction>
+TransferSolution(mfem::FiniteElementSpace &fes,
+                 const std::string &old_mesh_path,
+                 const std::string &old_solution_path);
+
+#endif // WARM_START_H